@@ -2,28 +2,33 @@ import discord
 from discord.ext import commands, tasks
 from discord.ui import Button, View
 import asyncio
-from datetime import datetime, timedelta
-from collections import defaultdict
 import os
-from typing import Optional, Dict, List
+import time
+from typing import Optional, Dict, List, Callable, Awaitable
 from dotenv import load_dotenv
 import logging
+import logging.handlers
+import queue
 import atexit
-import signal
-import psycopg2
-from psycopg2.extras import Json
-import json
-import discord
-from discord.ext import commands, tasks
-from discord.ext.commands import CommandOnCooldown
+import asyncpg
 
 load_dotenv()
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='[%(asctime)s] %(levelname)s: %(message)s',
+# Log records are handed to a background thread so handler I/O never blocks the event loop.
+# QueueHandler.prepare() still merges the message and traceback on the calling thread;
+# the listener thread adds the timestamp/level prefix and does the write.
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(
+    '[%(asctime)s] %(levelname)s: %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
-)
+))
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+# Attached directly: basicConfig would give the QueueHandler its own prefixed format
+logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
+logging.getLogger().setLevel(logging.INFO)
 
 class Config:
     OWNER_ID = 1439497398190866495
@@ -32,19 +37,32 @@ class Config:
     PREFIX = '!'
     PORT = int(os.getenv('PORT', 8080))
     
+    # Database pool size
+    DB_POOL_MIN = int(os.getenv('DB_POOL_MIN', 2))
+    DB_POOL_MAX = int(os.getenv('DB_POOL_MAX', 10))
+    
+    # Commands allowed to run at once; the rest wait their turn
+    MAX_CONCURRENT_COMMANDS = int(os.getenv('MAX_CONCURRENT_COMMANDS', 8))
+    # Commands that never queue behind slower ones (prebuilt embed / cached cooldown)
+    UNTHROTTLED_COMMANDS = frozenset({'help', 'cooldown'})
+    
     # Reputation Settings
     VOUCH_REP_AMOUNT = 1
     VOUCH_COOLDOWN = 600
+    VOUCH_COOLDOWN_MINUTES = VOUCH_COOLDOWN // 60
     LEADERBOARD_PER_PAGE = 10
+    LEADERBOARD_CACHE_TTL = 30
+    SCAM_REPORT_CACHE_TTL = 60
+    REP_CACHE_TTL = 30
     
     # Staff role IDs
-    STAFF_ROLE_IDS = [
+    STAFF_ROLE_IDS = frozenset({
         1445260636618756198,  # MOD
         1445260631358836799,  # Head Mod
         1445260626904612944,  # ADMIN
         1445260616695681075,  # CO OWNER
         1445260607392714752   # OWNER
-    ]
+    })
     
     # Feature settings
     HELPVOUCH_REP_MEMBER = 1
@@ -52,6 +70,13 @@ class Config:
     DUMMY_PER_DAY = 3
     DUMMY_REP_REMOVE = 1
 
+# Embed labels that only depend on Config
+_COOLDOWN_LENGTH_LABEL = f"{Config.VOUCH_COOLDOWN_MINUTES} minutes"
+_COOLDOWN_RULE_LABEL = f"You can vouch once every {Config.VOUCH_COOLDOWN_MINUTES} minutes"
+_NEXT_VOUCH_LABEL = f"Available in {Config.VOUCH_COOLDOWN_MINUTES} minutes"
+_VOUCH_GAIN_LABEL = f"+{Config.VOUCH_REP_AMOUNT} ⭐"
+_DUMMY_LOSS_LABEL = f"-{Config.DUMMY_REP_REMOVE} ⭐"
+
 class DatabaseManager:
     """PostgreSQL Database - DATA PERSISTS FOREVER"""
     
@@ -62,87 +87,161 @@ class DatabaseManager:
             logging.error("❌ DATABASE_URL not set!")
             raise ValueError("DATABASE_URL environment variable required")
         
-        self.conn = None
-        self.connect()
-        self.init_database()
-        logging.info("✅ Database connected")
-    
-    def connect(self):
-        """Connect to PostgreSQL"""
+        self.pool = None
+        self.rep_version = 0
+        self.blacklist_version = 0
+        self._stats_cache = None
+        self._stats_cached_at = 0.0
+        self._blacklist = None
+        # voucher_id -> time.time() of last vouch; only cooldowns still running are kept
+        self._cooldown_cache: Dict[int, float] = {}
+        # user_id -> (cached_at, reputation), overwritten by every reputation write
+        self._rep_cache: Dict[int, tuple] = {}
+        # user_id -> (fetched_at, reports), dropped on report writes
+        self._scam_cache: Dict[int, tuple] = {}
+    
+    async def connect(self):
+        """Open the PostgreSQL connection pool and create tables"""
         try:
-            self.conn = psycopg2.connect(self.db_url)
-            self.conn.autocommit = True
+            self.pool = await asyncpg.create_pool(
+                dsn=self.db_url,
+                min_size=Config.DB_POOL_MIN,
+                max_size=Config.DB_POOL_MAX,
+                timeout=5,
+                command_timeout=30,
+                max_inactive_connection_lifetime=120,
+                server_settings={
+                    'application_name': 'rep-bot',
+                    # Keep idle connections alive through NAT timeouts
+                    'tcp_keepalives_idle': '30',
+                    'tcp_keepalives_interval': '10',
+                    'tcp_keepalives_count': '5'
+                }
+            )
             logging.info("✅ PostgreSQL connected")
         except Exception as e:
             logging.error(f"❌ Connection failed: {e}")
             raise
+        await self.init_database()
+        logging.info("✅ Database connected")
     
-    def init_database(self):
+    async def close(self):
+        """Close the connection pool"""
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+            logging.info("Database pool closed")
+    
+    async def init_database(self):
         """Create tables"""
         try:
-            cursor = self.conn.cursor()
-            
-            # Users table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS users (
-                    user_id BIGINT PRIMARY KEY,
-                    reputation INTEGER DEFAULT 0,
-                    is_blacklisted BOOLEAN DEFAULT FALSE
-                )
-            ''')
-            
-            # Vouches table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS vouches (
-                    id SERIAL PRIMARY KEY,
-                    target_id BIGINT NOT NULL,
-                    voucher_id BIGINT NOT NULL,
-                    reason TEXT NOT NULL,
-                    rep_amount INTEGER NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-
-            # Cooldowns table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS cooldowns (
-                    user_id BIGINT PRIMARY KEY,
-                    last_vouch TIMESTAMP NOT NULL
-                )
-            ''')
+            async with self.pool.acquire() as conn:
+                # Users table
+                await conn.execute('''
+                    CREATE TABLE IF NOT EXISTS users (
+                        user_id BIGINT PRIMARY KEY,
+                        reputation INTEGER DEFAULT 0,
+                        is_blacklisted BOOLEAN DEFAULT FALSE
+                    )
+                ''')
+                
+                # Vouches table
+                await conn.execute('''
+                    CREATE TABLE IF NOT EXISTS vouches (
+                        id SERIAL PRIMARY KEY,
+                        target_id BIGINT NOT NULL,
+                        voucher_id BIGINT NOT NULL,
+                        reason TEXT NOT NULL,
+                        rep_amount INTEGER NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                
+                # Cooldowns table
+                await conn.execute('''
+                    CREATE TABLE IF NOT EXISTS cooldowns (
+                        user_id BIGINT PRIMARY KEY,
+                        last_vouch TIMESTAMP NOT NULL
+                    )
+                ''')
+                
+                # Dummy usage table
+                await conn.execute('''
+                    CREATE TABLE IF NOT EXISTS dummy_usage (
+                        user_id BIGINT PRIMARY KEY,
+                        usage_date DATE NOT NULL,
+                        count INTEGER DEFAULT 0
+                    )
+                ''')
+                
+                # Helpvouches table
+                await conn.execute('''
+                    CREATE TABLE IF NOT EXISTS helpvouches (
+                        id SERIAL PRIMARY KEY,
+                        target_id BIGINT NOT NULL,
+                        helper_id BIGINT NOT NULL,
+                        amount INTEGER NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                
+                # scam table
+                await conn.execute('''
+                    CREATE TABLE IF NOT EXISTS scammer_reports (
+                        id SERIAL PRIMARY KEY,
+                        user_id BIGINT NOT NULL,
+                        reporter_id BIGINT NOT NULL,
+                        reason TEXT NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                
+                # Denormalized report count, kept in step by the scammer functions
+                await conn.execute('''
+                    ALTER TABLE users
+                    ADD COLUMN IF NOT EXISTS scammer_report_count INTEGER NOT NULL DEFAULT 0
+                ''')
+                await conn.execute('''
+                    INSERT INTO users (user_id, scammer_report_count)
+                    SELECT user_id, COUNT(*) FROM scammer_reports GROUP BY user_id
+                    ON CONFLICT (user_id)
+                    DO UPDATE SET scammer_report_count = EXCLUDED.scammer_report_count
+                    WHERE users.scammer_report_count <> EXCLUDED.scammer_report_count
+                ''')
+                await conn.execute('''
+                    UPDATE users SET scammer_report_count = 0
+                    WHERE scammer_report_count > 0
+                    AND user_id NOT IN (SELECT user_id FROM scammer_reports)
+                ''')
+                
+                # Last known name, so stats can show a user without a Discord lookup
+                await conn.execute('''
+                    ALTER TABLE users ADD COLUMN IF NOT EXISTS username TEXT
+                ''')
+                
+                # Indexes for per-user lookups and the leaderboard
+                await conn.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_vouches_target_created
+                    ON vouches (target_id, created_at DESC)
+                ''')
+                await conn.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_helpvouches_target
+                    ON helpvouches (target_id)
+                ''')
+                await conn.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_scammer_user_created
+                    ON scammer_reports (user_id, created_at DESC)
+                ''')
+                # Same ordering as the leaderboard: pages and the top user are index scans
+                await conn.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_users_rep
+                    ON users (reputation DESC, user_id) WHERE reputation > 0
+                ''')
+                await conn.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_users_scammer
+                    ON users (scammer_report_count DESC) WHERE scammer_report_count > 0
+                ''')
             
-            # Dummy usage table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS dummy_usage (
-                    user_id BIGINT PRIMARY KEY,
-                    usage_date DATE NOT NULL,
-                    count INTEGER DEFAULT 0
-                )
-            ''')
-            
-            # Helpvouches table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS helpvouches (
-                    id SERIAL PRIMARY KEY,
-                    target_id BIGINT NOT NULL,
-                    helper_id BIGINT NOT NULL,
-                    amount INTEGER NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-
-            # scam table
-            cursor.execute('''
-               CREATE TABLE IF NOT EXISTS scammer_reports (
-                   id SERIAL PRIMARY KEY,
-                   user_id BIGINT NOT NULL,
-                   reporter_id BIGINT NOT NULL,
-                   reason TEXT NOT NULL,
-                   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-              )
-          ''')
-            
-            cursor.close()
             logging.info("✅ Database tables created")
             
         except Exception as e:
@@ -153,318 +252,528 @@ class DatabaseManager:
     # REPUTATION FUNCTIONS
     # ========================================
     
-    def get_reputation(self, user_id: int) -> int:
+    async def get_reputation(self, user_id: int) -> int:
         """Get user reputation"""
+        cached = self._rep_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < Config.REP_CACHE_TTL:
+            return cached[1]
+        version = self.rep_version
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('SELECT reputation FROM users WHERE user_id = %s', (user_id,))
-            result = cursor.fetchone()
-            cursor.close()
-            return result[0] if result else 0
+            async with self.pool.acquire() as conn:
+                result = await conn.fetchval('SELECT reputation FROM users WHERE user_id = $1', user_id)
+            rep = result or 0
+            if version == self.rep_version:
+                self._cache_rep(user_id, rep)
+            return rep
         except Exception as e:
             logging.error(f"Error getting rep: {e}")
             return 0
     
-    def add_reputation(self, user_id: int, amount: int):
-        """Add reputation"""
+    async def adjust_reputation(self, user_id: int, delta: int) -> tuple[int, int]:
+        """Add delta to reputation (floored at 0); return (old_rep, new_rep)"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT INTO users (user_id, reputation)
-                VALUES (%s, %s)
-                ON CONFLICT (user_id)
-                DO UPDATE SET reputation = users.reputation + %s
-            ''', (user_id, amount, amount))
-            cursor.close()
+            async with self.pool.acquire() as conn:
+                row = await conn.fetchrow('''
+                    WITH old AS (
+                        SELECT reputation FROM users WHERE user_id = $1
+                    ), upd AS (
+                        INSERT INTO users (user_id, reputation)
+                        VALUES ($1, GREATEST(0, $2))
+                        ON CONFLICT (user_id)
+                        DO UPDATE SET reputation = GREATEST(0, users.reputation + $2)
+                        RETURNING reputation
+                    )
+                    SELECT COALESCE((SELECT reputation FROM old), 0), (SELECT reputation FROM upd)
+                ''', user_id, delta)
+            self._cache_rep(user_id, row[1])
+            self._reputation_changed()
+            return row[0], row[1]
         except Exception as e:
-            logging.error(f"Error adding rep: {e}")
+            logging.error(f"Error adjusting rep: {e}")
+            rep = await self.get_reputation(user_id)
+            return rep, rep
     
-    def remove_reputation(self, user_id: int, amount: int):
-        """Remove reputation"""
+    async def set_reputation(self, user_id: int, amount: int) -> tuple[int, int]:
+        """Set reputation; return (old_rep, new_rep)"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT INTO users (user_id, reputation)
-                VALUES (%s, 0)
-                ON CONFLICT (user_id)
-                DO UPDATE SET reputation = GREATEST(0, users.reputation - %s)
-            ''', (user_id, amount))
-            cursor.close()
-        except Exception as e:
-            logging.error(f"Error removing rep: {e}")
-    
-    def set_reputation(self, user_id: int, amount: int):
-        """Set reputation"""
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT INTO users (user_id, reputation)
-                VALUES (%s, %s)
-                ON CONFLICT (user_id)
-                DO UPDATE SET reputation = %s
-            ''', (user_id, amount, amount))
-            cursor.close()
+            async with self.pool.acquire() as conn:
+                row = await conn.fetchrow('''
+                    WITH old AS (
+                        SELECT reputation FROM users WHERE user_id = $1
+                    ), upd AS (
+                        INSERT INTO users (user_id, reputation)
+                        VALUES ($1, $2)
+                        ON CONFLICT (user_id)
+                        DO UPDATE SET reputation = $2
+                        RETURNING reputation
+                    )
+                    SELECT COALESCE((SELECT reputation FROM old), 0), (SELECT reputation FROM upd)
+                ''', user_id, amount)
+            self._cache_rep(user_id, row[1])
+            self._reputation_changed()
+            return row[0], row[1]
         except Exception as e:
             logging.error(f"Error setting rep: {e}")
+            rep = await self.get_reputation(user_id)
+            return rep, rep
     
-    def clear_reputation(self, user_id: int):
+    async def clear_reputation(self, user_id: int):
         """Clear user data"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('DELETE FROM users WHERE user_id = %s', (user_id,))
-            cursor.execute('DELETE FROM vouches WHERE target_id = %s', (user_id,))
-            cursor.execute('DELETE FROM helpvouches WHERE target_id = %s', (user_id,))
-            cursor.close()
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    # Keep the row itself so its scammer report count survives
+                    await conn.execute('''
+                        UPDATE users SET reputation = 0, is_blacklisted = FALSE
+                        WHERE user_id = $1
+                    ''', user_id)
+                    await conn.execute('DELETE FROM vouches WHERE target_id = $1', user_id)
+                    await conn.execute('DELETE FROM helpvouches WHERE target_id = $1', user_id)
+            self._cache_rep(user_id, 0)
+            self._reputation_changed()
+            if self._blacklist is not None and user_id in self._blacklist:
+                self._blacklist.discard(user_id)
+                self.blacklist_version += 1
         except Exception as e:
             logging.error(f"Error clearing rep: {e}")
     
-    def get_leaderboard(self) -> List[tuple]:
-        """Get leaderboard"""
+    def _cache_rep(self, user_id: int, rep: int):
+        """Remember a user's rep for REP_CACHE_TTL (edits made outside the bot age out)"""
+        if len(self._rep_cache) >= 4096:
+            self._rep_cache.clear()
+        self._rep_cache[user_id] = (time.monotonic(), rep)
+    
+    def _reputation_changed(self):
+        """Invalidate cached stats after a reputation write"""
+        self._stats_cache = None
+        self.rep_version += 1
+    
+    async def get_leaderboard_page(self, offset: int, limit: int) -> List[tuple]:
+        """Get one slice of the leaderboard"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT user_id, reputation 
-                FROM users 
-                WHERE reputation > 0
-                ORDER BY reputation DESC
-            ''')
-            result = cursor.fetchall()
-            cursor.close()
-            return result
+            async with self.pool.acquire() as conn:
+                rows = await conn.fetch('''
+                    SELECT user_id, reputation
+                    FROM users
+                    WHERE reputation > 0
+                    ORDER BY reputation DESC, user_id
+                    OFFSET $1 LIMIT $2
+                ''', offset, limit)
+            return [tuple(row) for row in rows]
         except Exception as e:
-            logging.error(f"Error getting leaderboard: {e}")
+            logging.error(f"Error getting leaderboard page: {e}")
             return []
     
+    async def get_user_rank(self, user_id: int, reputation: int) -> Optional[int]:
+        """Get leaderboard position for a user with the given rep (None if unranked)"""
+        if reputation <= 0:
+            return None
+        try:
+            async with self.pool.acquire() as conn:
+                # Counts the users ahead in (reputation DESC, user_id) order: a range scan on idx_users_rep
+                return await conn.fetchval('''
+                    SELECT COUNT(*) + 1
+                    FROM users
+                    WHERE reputation > 0
+                    AND (reputation > $2 OR (reputation = $2 AND user_id < $1))
+                ''', user_id, reputation)
+        except Exception as e:
+            logging.error(f"Error getting rank: {e}")
+            return None
+    
+    async def get_leaderboard_count(self) -> int:
+        """Count users with reputation"""
+        try:
+            async with self.pool.acquire() as conn:
+                return await conn.fetchval('''
+                    SELECT COUNT(*) FROM users WHERE reputation > 0
+                ''')
+        except Exception as e:
+            logging.error(f"Error counting users: {e}")
+            return 0
+    
+    async def get_stats(self) -> Dict:
+        """Get ranked user count, total reputation and the top user"""
+        stats = self._stats_cache
+        if stats is not None and time.monotonic() - self._stats_cached_at < Config.LEADERBOARD_CACHE_TTL:
+            return stats
+        version = self.rep_version
+        try:
+            async with self.pool.acquire() as conn:
+                row = await conn.fetchrow('''
+                    WITH top AS (
+                        SELECT user_id, reputation, username
+                        FROM users
+                        WHERE reputation > 0
+                        ORDER BY reputation DESC, user_id
+                        LIMIT 1
+                    )
+                    SELECT COUNT(*) AS users,
+                           COALESCE(SUM(reputation), 0) AS total_rep,
+                           (SELECT user_id FROM top) AS top_user_id,
+                           (SELECT reputation FROM top) AS top_rep,
+                           (SELECT username FROM top) AS top_username
+                    FROM users
+                    WHERE reputation > 0
+                ''')
+            stats = dict(row)
+        except Exception as e:
+            logging.error(f"Error getting stats: {e}")
+            return stats or {'users': 0, 'total_rep': 0, 'top_user_id': None,
+                             'top_rep': None, 'top_username': None}
+        if version == self.rep_version:
+            self._stats_cache = stats
+            self._stats_cached_at = time.monotonic()
+        return stats
+    
     # ========================================
     # VOUCH FUNCTIONS
     # ========================================
     
-    def add_vouch(self, target_id: int, voucher_id: int, reason: str):
-        """Add vouch"""
+    async def add_vouch(self, target_id: int, voucher_id: int, reason: str,
+                        target_name: Optional[str] = None) -> int:
+        """Record a vouch, start the cooldown and add rep; returns the new total"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT INTO vouches (target_id, voucher_id, reason, rep_amount)
-                VALUES (%s, %s, %s, %s)
-            ''', (target_id, voucher_id, reason, Config.VOUCH_REP_AMOUNT))
-            
-            # Update cooldown
-            cursor.execute('''
-                INSERT INTO cooldowns (user_id, last_vouch)
-                VALUES (%s, CURRENT_TIMESTAMP)
-                ON CONFLICT (user_id)
-                DO UPDATE SET last_vouch = CURRENT_TIMESTAMP
-            ''', (voucher_id,))
-            
-            cursor.close()
+            async with self.pool.acquire() as conn:
+                new_rep = await conn.fetchval('''
+                    WITH v AS (
+                        INSERT INTO vouches (target_id, voucher_id, reason, rep_amount)
+                        VALUES ($1, $2, $3, $4)
+                    ), c AS (
+                        INSERT INTO cooldowns (user_id, last_vouch)
+                        VALUES ($2, CURRENT_TIMESTAMP)
+                        ON CONFLICT (user_id)
+                        DO UPDATE SET last_vouch = CURRENT_TIMESTAMP
+                    )
+                    INSERT INTO users (user_id, reputation, username)
+                    VALUES ($1, $4, $5)
+                    ON CONFLICT (user_id)
+                    DO UPDATE SET reputation = users.reputation + $4,
+                                  username = COALESCE($5, users.username)
+                    RETURNING reputation
+                ''', target_id, voucher_id, reason, Config.VOUCH_REP_AMOUNT, target_name)
+            self._start_cooldown(voucher_id)
+            self._cache_rep(target_id, new_rep)
+            self._reputation_changed()
+            return new_rep
         except Exception as e:
             logging.error(f"Error adding vouch: {e}")
-    
-    def get_vouch_cooldown(self, user_id: int) -> Optional[float]:
+            return await self.get_reputation(target_id)
+    
+    def _start_cooldown(self, user_id: int):
+        """Remember a new vouch, sweeping out cooldowns that have run out"""
+        if len(self._cooldown_cache) >= 4096:
+            cutoff = time.time() - Config.VOUCH_COOLDOWN
+            self._cooldown_cache = {
+                uid: at for uid, at in self._cooldown_cache.items() if at > cutoff
+            }
+        self._cooldown_cache[user_id] = time.time()
+    
+    async def get_vouch_cooldown(self, user_id: int) -> Optional[float]:
         """Get cooldown in seconds"""
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT EXTRACT(EPOCH FROM (CURRENT_TIMESTAMP - last_vouch))
-                FROM cooldowns WHERE user_id = %s
-            ''', (user_id,))
-            result = cursor.fetchone()
-            cursor.close()
-            
-            if not result:
-                return None
-            
-            time_passed = result[0]
-            if time_passed >= Config.VOUCH_COOLDOWN:
+        last_vouch = self._cooldown_cache.get(user_id)
+        if last_vouch is None:
+            try:
+                async with self.pool.acquire() as conn:
+                    time_passed = await conn.fetchval('''
+                        SELECT EXTRACT(EPOCH FROM (CURRENT_TIMESTAMP - last_vouch))
+                        FROM cooldowns WHERE user_id = $1
+                    ''', user_id)
+            except Exception as e:
+                logging.error(f"Error getting cooldown: {e}")
                 return None
             
-            return Config.VOUCH_COOLDOWN - time_passed
-        except Exception as e:
-            logging.error(f"Error getting cooldown: {e}")
+            last_vouch = 0.0 if time_passed is None else time.time() - float(time_passed)
+            # A vouch may have been recorded while the query was in flight
+            last_vouch = max(last_vouch, self._cooldown_cache.get(user_id, 0.0))
+        
+        time_passed = time.time() - last_vouch
+        if time_passed >= Config.VOUCH_COOLDOWN:
+            self._cooldown_cache.pop(user_id, None)
             return None
+        
+        self._cooldown_cache[user_id] = last_vouch
+        return Config.VOUCH_COOLDOWN - time_passed
     
-    def get_vouch_history(self, user_id: int, limit: int = 10) -> List[Dict]:
+    async def get_vouch_history(self, user_id: int, limit: int = 10) -> List[Dict]:
         """Get vouch history"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT voucher_id, reason, rep_amount, created_at
-                FROM vouches
-                WHERE target_id = %s
-                ORDER BY created_at DESC
-                LIMIT %s
-            ''', (user_id, limit))
-            results = cursor.fetchall()
-            cursor.close()
+            async with self.pool.acquire() as conn:
+                results = await conn.fetch('''
+                    SELECT voucher_id, reason, rep_amount, created_at
+                    FROM vouches
+                    WHERE target_id = $1
+                    ORDER BY created_at DESC
+                    LIMIT $2
+                ''', user_id, limit)
             
             return [{
                 'voucher': row[0],
                 'reason': row[1],
                 'rep_amount': row[2],
-                'timestamp': row[3].isoformat()
+                'timestamp': row[3]
             } for row in results]
         except Exception as e:
             logging.error(f"Error getting history: {e}")
             return []
     
+    async def count_vouches(self, user_id: int) -> int:
+        """Count vouches received"""
+        try:
+            async with self.pool.acquire() as conn:
+                return await conn.fetchval('''
+                    SELECT COUNT(*) FROM vouches WHERE target_id = $1
+                ''', user_id)
+        except Exception as e:
+            logging.error(f"Error counting vouches: {e}")
+            return 0
+    
     # ========================================
     # DUMMY FUNCTIONS
     # ========================================
     
-    def can_use_dummy(self, user_id: int) -> tuple[bool, int]:
+    async def can_use_dummy(self, user_id: int) -> tuple[bool, int]:
         """Check dummy usage"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT count, usage_date FROM dummy_usage WHERE user_id = %s
-            ''', (user_id,))
-            result = cursor.fetchone()
-            cursor.close()
+            async with self.pool.acquire() as conn:
+                used = await conn.fetchval('''
+                    SELECT count FROM dummy_usage
+                    WHERE user_id = $1 AND usage_date = CURRENT_DATE
+                ''', user_id)
             
-            today = datetime.utcnow().date()
-            
-            if not result:
-                return True, Config.DUMMY_PER_DAY
-            
-            count, usage_date = result
-            
-            if usage_date != today:
+            if used is None:
                 return True, Config.DUMMY_PER_DAY
             
-            remaining = Config.DUMMY_PER_DAY - count
+            remaining = Config.DUMMY_PER_DAY - used
             return remaining > 0, remaining
             
         except Exception as e:
             logging.error(f"Error checking dummy: {e}")
             return True, Config.DUMMY_PER_DAY
     
-    def use_dummy(self, user_id: int):
-        """Record dummy usage"""
+    async def apply_dummy(self, target_id: int, actor_id: int, amount: int) -> tuple[int, int, int]:
+        """Remove rep and record dummy usage; return (old_rep, new_rep, remaining_uses)"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT INTO dummy_usage (user_id, usage_date, count)
-                VALUES (%s, CURRENT_DATE, 1)
-                ON CONFLICT (user_id)
-                DO UPDATE SET 
-                    count = CASE 
-                        WHEN dummy_usage.usage_date = CURRENT_DATE 
-                        THEN dummy_usage.count + 1 
-                        ELSE 1 
-                    END,
-                    usage_date = CURRENT_DATE
-            ''', (user_id,))
-            cursor.close()
+            async with self.pool.acquire() as conn:
+                row = await conn.fetchrow('''
+                    WITH old AS (
+                        SELECT reputation FROM users WHERE user_id = $1
+                    ), upd AS (
+                        INSERT INTO users (user_id, reputation)
+                        VALUES ($1, 0)
+                        ON CONFLICT (user_id)
+                        DO UPDATE SET reputation = GREATEST(0, users.reputation - $3)
+                        RETURNING reputation
+                    ), used AS (
+                        INSERT INTO dummy_usage (user_id, usage_date, count)
+                        VALUES ($2, CURRENT_DATE, 1)
+                        ON CONFLICT (user_id)
+                        DO UPDATE SET 
+                            count = CASE 
+                                WHEN dummy_usage.usage_date = CURRENT_DATE 
+                                THEN dummy_usage.count + 1 
+                                ELSE 1 
+                            END,
+                            usage_date = CURRENT_DATE
+                        RETURNING count
+                    )
+                    SELECT COALESCE((SELECT reputation FROM old), 0) AS old_rep,
+                           (SELECT reputation FROM upd) AS new_rep,
+                           (SELECT count FROM used) AS used
+                ''', target_id, actor_id, amount)
+            self._cache_rep(target_id, row['new_rep'])
+            self._reputation_changed()
+            return row['old_rep'], row['new_rep'], max(0, Config.DUMMY_PER_DAY - row['used'])
         except Exception as e:
-            logging.error(f"Error using dummy: {e}")
+            logging.error(f"Error applying dummy: {e}")
+            rep = await self.get_reputation(target_id)
+            _, remaining = await self.can_use_dummy(actor_id)
+            return rep, rep, remaining
+    
+    async def prune_dummy_usage(self):
+        """Delete dummy usage rows from previous days"""
+        try:
+            async with self.pool.acquire() as conn:
+                status = await conn.execute('''
+                    DELETE FROM dummy_usage WHERE usage_date < CURRENT_DATE
+                ''')
+            pruned = int(status.split()[-1])
+            if pruned:
+                logging.info(f"Pruned {pruned} stale dummy usage rows")
+        except Exception as e:
+            logging.error(f"Error pruning dummy usage: {e}")
 
     # ========================================
     # HELPVOUCH FUNCTIONS
     # ========================================
     
-    def add_helpvouch(self, target_id: int, helper_id: int, amount: int):
-        """Add helpvouch"""
+    async def apply_helpvouch(self, target_id: int, helper_id: int, amount: int,
+                              target_name: Optional[str] = None) -> tuple[int, int]:
+        """Add rep and record the helpvouch; return (old_rep, new_rep)"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT INTO helpvouches (target_id, helper_id, amount)
-                VALUES (%s, %s, %s)
-            ''', (target_id, helper_id, amount))
-            cursor.close()
+            async with self.pool.acquire() as conn:
+                row = await conn.fetchrow('''
+                    WITH old AS (
+                        SELECT reputation FROM users WHERE user_id = $1
+                    ), hv AS (
+                        INSERT INTO helpvouches (target_id, helper_id, amount)
+                        VALUES ($1, $2, $3)
+                    ), upd AS (
+                        INSERT INTO users (user_id, reputation, username)
+                        VALUES ($1, $3, $4)
+                        ON CONFLICT (user_id)
+                        DO UPDATE SET reputation = users.reputation + $3,
+                                      username = COALESCE($4, users.username)
+                        RETURNING reputation
+                    )
+                    SELECT COALESCE((SELECT reputation FROM old), 0) AS old_rep,
+                           (SELECT reputation FROM upd) AS new_rep
+                ''', target_id, helper_id, amount, target_name)
+            self._cache_rep(target_id, row['new_rep'])
+            self._reputation_changed()
+            return row['old_rep'], row['new_rep']
         except Exception as e:
-            logging.error(f"Error adding helpvouch: {e}")
+            logging.error(f"Error applying helpvouch: {e}")
+            rep = await self.get_reputation(target_id)
+            return rep, rep
     
     # ========================================
     # SCAMMER FUNCTIONS
     # ========================================
     
-    def add_scammer_report(self, user_id: int, reporter_id: int, reason: str):
-        """Add a scammer report (Staff only)"""
+    async def add_scammer_report(self, user_id: int, reporter_id: int, reason: str) -> tuple[Optional[int], int]:
+        """Add a scammer report (Staff only); returns (report id, user's total reports)"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT INTO scammer_reports (user_id, reporter_id, reason)
-                VALUES (%s, %s, %s)
-            ''', (user_id, reporter_id, reason))
-            cursor.close()
+            async with self.pool.acquire() as conn:
+                row = await conn.fetchrow('''
+                    WITH r AS (
+                        INSERT INTO scammer_reports (user_id, reporter_id, reason)
+                        VALUES ($1, $2, $3)
+                        RETURNING id
+                    ), u AS (
+                        INSERT INTO users (user_id, scammer_report_count)
+                        VALUES ($1, 1)
+                        ON CONFLICT (user_id)
+                        DO UPDATE SET scammer_report_count = users.scammer_report_count + 1
+                        RETURNING scammer_report_count
+                    )
+                    SELECT r.id, u.scammer_report_count FROM r, u
+                ''', user_id, reporter_id, reason)
+            self._scam_cache.pop(user_id, None)
             logging.info(f"Scammer report added: {reporter_id} -> {user_id}")
+            return row[0], row[1]
         except Exception as e:
             logging.error(f"Error adding scammer report: {e}")
+            return None, await self.count_scammer_reports(user_id)
+    
+    async def count_scammer_reports(self, user_id: int) -> int:
+        """Count scammer reports for a user"""
+        try:
+            async with self.pool.acquire() as conn:
+                count = await conn.fetchval('''
+                    SELECT scammer_report_count FROM users WHERE user_id = $1
+                ''', user_id)
+            return count or 0
+        except Exception as e:
+            logging.error(f"Error counting scammer reports: {e}")
+            return 0
 
-    def get_scammer_reports(self, user_id: int) -> List[Dict]:
-        """Get all scammer reports for a user"""
+    async def get_scammer_reports(self, user_id: int) -> List[Dict]:
+        """Get all scammer reports for a user (cached briefly)"""
+        cached = self._scam_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[0] < Config.SCAM_REPORT_CACHE_TTL:
+            return cached[1]
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT id, reporter_id, reason, created_at
-                FROM scammer_reports
-                WHERE user_id = %s
-                ORDER BY created_at DESC
-            ''', (user_id,))
-            results = cursor.fetchall()
-            cursor.close()
+            async with self.pool.acquire() as conn:
+                results = await conn.fetch('''
+                    SELECT id, reporter_id, reason, created_at
+                    FROM scammer_reports
+                    WHERE user_id = $1
+                    ORDER BY created_at DESC
+                ''', user_id)
             
-            return [{
+            reports = [{
                 'id': row[0],
                 'reporter': row[1],
                 'reason': row[2],
-                'timestamp': row[3].isoformat()
+                'timestamp': row[3],
+                'time_str': row[3].strftime('%Y-%m-%d %H:%M UTC')
             } for row in results]
+            if len(self._scam_cache) >= 4096:
+                self._scam_cache.clear()
+            self._scam_cache[user_id] = (time.monotonic(), reports)
+            return reports
         except Exception as e:
             logging.error(f"Error getting scammer reports: {e}")
             return []
 
-    def remove_scammer_report(self, report_id: int):
+    async def remove_scammer_report(self, report_id: int):
         """Remove a specific scammer report by ID"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                DELETE FROM scammer_reports WHERE id = %s
-            ''', (report_id,))
-            cursor.close()
+            async with self.pool.acquire() as conn:
+                user_id = await conn.fetchval('''
+                    WITH r AS (
+                        DELETE FROM scammer_reports WHERE id = $1 RETURNING user_id
+                    )
+                    UPDATE users SET scammer_report_count = users.scammer_report_count - 1
+                    FROM r WHERE users.user_id = r.user_id
+                    RETURNING users.user_id
+                ''', report_id)
+            self._scam_cache.pop(user_id, None)
             logging.info(f"Scammer report {report_id} removed")
         except Exception as e:
             logging.error(f"Error removing scammer report: {e}")
 
-    def clear_all_scammer_reports(self, user_id: int):
+    async def clear_all_scammer_reports(self, user_id: int):
         """Clear all scammer reports for a user"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                DELETE FROM scammer_reports WHERE user_id = %s
-            ''', (user_id,))
-            cursor.close()
+            async with self.pool.acquire() as conn:
+                await conn.execute('''
+                    WITH r AS (
+                        DELETE FROM scammer_reports WHERE user_id = $1
+                    )
+                    UPDATE users SET scammer_report_count = 0 WHERE user_id = $1
+                ''', user_id)
+            self._scam_cache.pop(user_id, None)
             logging.info(f"All scammer reports cleared for user {user_id}")
         except Exception as e:
             logging.error(f"Error clearing scammer reports: {e}")
 
-    def get_all_scammers(self) -> List[tuple]:
-        """Get all users who have scammer reports"""
+    async def get_all_scammers(self, limit: Optional[int] = None) -> List[tuple]:
+        """Get users who have scammer reports, most reported first"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT user_id, COUNT(*) as report_count
-                FROM scammer_reports
-                GROUP BY user_id
-                ORDER BY report_count DESC
-            ''')
-            results = cursor.fetchall()
-            cursor.close()
-            return results
+            async with self.pool.acquire() as conn:
+                results = await conn.fetch('''
+                    SELECT user_id, scammer_report_count
+                    FROM users
+                    WHERE scammer_report_count > 0
+                    ORDER BY scammer_report_count DESC, user_id
+                    LIMIT $1
+                ''', limit)
+            return [tuple(row) for row in results]
         except Exception as e:
             logging.error(f"Error getting all scammers: {e}")
             return []
+    
+    async def count_scammers(self) -> int:
+        """Count users who have scammer reports"""
+        try:
+            async with self.pool.acquire() as conn:
+                return await conn.fetchval('''
+                    SELECT COUNT(*) FROM users WHERE scammer_report_count > 0
+                ''')
+        except Exception as e:
+            logging.error(f"Error counting scammers: {e}")
+            return 0
 
-    def is_reported_scammer(self, user_id: int) -> bool:
+    async def is_reported_scammer(self, user_id: int) -> bool:
         """Check if user has any scammer reports"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT COUNT(*) FROM scammer_reports WHERE user_id = %s
-            ''', (user_id,))
-            result = cursor.fetchone()
-            cursor.close()
-            return result[0] > 0 if result else False
+            async with self.pool.acquire() as conn:
+                count = await conn.fetchval('''
+                    SELECT scammer_report_count FROM users WHERE user_id = $1
+                ''', user_id)
+            return bool(count)
         except Exception as e:
             logging.error(f"Error checking scammer status: {e}")
             return False
@@ -473,60 +782,59 @@ class DatabaseManager:
     # BLACKLIST FUNCTIONS
     # ========================================
     
-    def is_blacklisted(self, user_id: int) -> bool:
-        """Check if blacklisted"""
+    async def _load_blacklist(self) -> set:
+        """Load blacklisted user IDs into memory once"""
+        if self._blacklist is not None:
+            return self._blacklist
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT is_blacklisted FROM users WHERE user_id = %s
-            ''', (user_id,))
-            result = cursor.fetchone()
-            cursor.close()
-            return result[0] if result else False
+            async with self.pool.acquire() as conn:
+                results = await conn.fetch('''
+                    SELECT user_id FROM users WHERE is_blacklisted = TRUE
+                ''')
+            self._blacklist = {row[0] for row in results}
+            return self._blacklist
         except Exception as e:
-            logging.error(f"Error checking blacklist: {e}")
-            return False
+            logging.error(f"Error loading blacklist: {e}")
+            return set()
+    
+    async def is_blacklisted(self, user_id: int) -> bool:
+        """Check if blacklisted"""
+        return user_id in await self._load_blacklist()
     
-    def add_to_blacklist(self, user_id: int):
+    async def add_to_blacklist(self, user_id: int):
         """Add to blacklist"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT INTO users (user_id, is_blacklisted)
-                VALUES (%s, TRUE)
-                ON CONFLICT (user_id)
-                DO UPDATE SET is_blacklisted = TRUE
-            ''', (user_id,))
-            cursor.close()
+            async with self.pool.acquire() as conn:
+                await conn.execute('''
+                    INSERT INTO users (user_id, is_blacklisted)
+                    VALUES ($1, TRUE)
+                    ON CONFLICT (user_id)
+                    DO UPDATE SET is_blacklisted = TRUE
+                ''', user_id)
+            if self._blacklist is not None:
+                self._blacklist.add(user_id)
+            self.blacklist_version += 1
         except Exception as e:
             logging.error(f"Error adding to blacklist: {e}")
     
-    def remove_from_blacklist(self, user_id: int):
+    async def remove_from_blacklist(self, user_id: int):
         """Remove from blacklist"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                UPDATE users SET is_blacklisted = FALSE WHERE user_id = %s
-            ''', (user_id,))
-            cursor.close()
+            async with self.pool.acquire() as conn:
+                await conn.execute('''
+                    UPDATE users SET is_blacklisted = FALSE WHERE user_id = $1
+                ''', user_id)
+            if self._blacklist is not None:
+                self._blacklist.discard(user_id)
+            self.blacklist_version += 1
         except Exception as e:
             logging.error(f"Error removing from blacklist: {e}")
     
-    def get_blacklist(self) -> List[int]:
+    async def get_blacklist(self) -> List[int]:
         """Get all blacklisted users"""
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                SELECT user_id FROM users WHERE is_blacklisted = TRUE
-            ''')
-            results = cursor.fetchall()
-            cursor.close()
-            return [row[0] for row in results]
-        except Exception as e:
-            logging.error(f"Error getting blacklist: {e}")
-            return []
+        return list(await self._load_blacklist())
 
-# Initialize database
+# Initialize database (the pool is opened in main())
 db = DatabaseManager()
     
   
@@ -536,7 +844,25 @@ intents.message_content = True
 intents.members = True
 intents.guilds = True
 
-bot = commands.Bot(
+class RepBot(commands.Bot):
+    """Bot that caps how many commands run at the same time"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._command_slots = asyncio.Semaphore(Config.MAX_CONCURRENT_COMMANDS)
+    
+    async def invoke(self, ctx):
+        if ctx.command is not None and ctx.command.name in Config.UNTHROTTLED_COMMANDS:
+            await super().invoke(ctx)
+            return
+        queued_at = time.monotonic()
+        async with self._command_slots:
+            wait_ms = (time.monotonic() - queued_at) * 1000
+            if wait_ms >= 100:
+                logging.info(f"Command {ctx.command} waited {wait_ms:.0f}ms for a free slot")
+            await super().invoke(ctx)
+
+bot = RepBot(
     command_prefix=Config.PREFIX,
     intents=intents,
     help_command=None,
@@ -553,7 +879,35 @@ def is_owner():
 
 def has_staff_role(member: discord.Member) -> bool:
     """Check if member has staff role"""
-    return any(role.id in Config.STAFF_ROLE_IDS for role in member.roles)
+    return not Config.STAFF_ROLE_IDS.isdisjoint(role.id for role in member.roles)
+
+# user_id -> display name; only resolved users are stored
+_user_names: Dict[int, str] = {}
+_USER_NAMES_MAX = 4096
+
+def remember_user_name(user_id: int, name: str):
+    """Store a resolved display name"""
+    if len(_user_names) >= _USER_NAMES_MAX:
+        _user_names.clear()
+    _user_names[user_id] = name
+
+def user_display_name(user_id: int) -> Optional[str]:
+    """Get a cached display name for a user, or None if unknown"""
+    name = _user_names.get(user_id)
+    if name is None:
+        user = bot.get_user(user_id)
+        if user is None:
+            return None
+        name = user.name
+        remember_user_name(user_id, name)
+    return name
+
+@bot.event
+async def on_user_update(before: discord.User, after: discord.User):
+    global _blacklist_render
+    if before.name != after.name:
+        _user_names.pop(after.id, None)
+        _blacklist_render = (None, "")
 
 def format_time(seconds: float) -> str:
     minutes = int(seconds // 60)
@@ -562,6 +916,53 @@ def format_time(seconds: float) -> str:
         return f"{minutes}m {secs}s"
     return f"{secs}s"
 
+# Embed text limits
+FIELD_VALUE_LIMIT = 1024
+DESCRIPTION_LIMIT = 4096
+
+def clip(text: str, limit: int = 200) -> str:
+    """Shorten text to limit characters, marking the cut with …"""
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
+def join_field_lines(lines: List[str], limit: int = FIELD_VALUE_LIMIT) -> tuple[str, int]:
+    """Join lines into one embed value; returns (value, lines shown)
+
+    Whole lines past the limit are dropped and replaced by a "+N more" line.
+    """
+    out = []
+    size = -1  # no newline before the first line
+    for line in lines:
+        if size + len(line) + 1 > limit:
+            break
+        out.append(line)
+        size += len(line) + 1
+    shown = len(out)
+    while shown < len(lines):
+        more = f"+{len(lines) - shown} more"
+        if size + len(more) + 1 <= limit:
+            out.append(more)
+            break
+        size -= len(out.pop()) + 1
+        shown -= 1
+    return "\n".join(out), shown
+
+# Strong references to fire-and-forget tasks so they aren't collected mid-flight
+_background_tasks = set()
+
+async def _send_dm_safe(user: discord.abc.User, embed: discord.Embed):
+    try:
+        await user.send(embed=embed)
+    except discord.Forbidden:
+        pass  # DMs closed
+    except Exception as e:
+        logging.error(f"Error sending DM to {user.id}: {e}")
+
+def send_dm_in_background(user: discord.abc.User, embed: discord.Embed):
+    """Send a DM without making the caller wait for it"""
+    task = asyncio.create_task(_send_dm_safe(user, embed))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
 # Add this near the top after bot initialization
 @bot.event
 async def on_ready():
@@ -586,15 +987,27 @@ async def on_ready():
     # Removed the presence update to reduce API calls
     # await bot.change_presence(...)  # Comment this out temporarily
     
+    if not prune_dummy_usage_task.is_running():
+        prune_dummy_usage_task.start()
+    
+    if not refresh_status_task.is_running():
+        refresh_status_task.start()
+    
     print('All systems active!')
     print('=' * 70)
+
+@tasks.loop(hours=24)
+async def prune_dummy_usage_task():
+    await db.prune_dummy_usage()
     
 # =============================
 # LEADERBOARD VIEW
 # ========================================
 
 class LeaderboardView(View):
-    def __init__(self, ctx, pages: List[discord.Embed], timeout=180):
+    __slots__ = ('ctx', 'pages', 'current_page', 'message')
+    
+    def __init__(self, ctx, pages: "LeaderboardPages", timeout=180):
         super().__init__(timeout=timeout)
         self.ctx = ctx
         self.pages = pages
@@ -608,46 +1021,45 @@ class LeaderboardView(View):
         self.next_page.disabled = self.current_page == len(self.pages) - 1
         self.last_page.disabled = self.current_page == len(self.pages) - 1
     
-    @discord.ui.button(label="⏮️", style=discord.ButtonStyle.gray)
-    async def first_page(self, interaction: discord.Interaction, button: Button):
+    async def _guard(self, interaction: discord.Interaction, action: str = "control") -> bool:
         if interaction.user.id != self.ctx.author.id:
-            await interaction.response.send_message("Only command user can control this.", ephemeral=True)
+            await interaction.response.send_message(f"Only command user can {action} this.", ephemeral=True)
+            return False
+        return True
+    
+    async def _show_page(self, interaction: discord.Interaction, page: int):
+        if not await self._guard(interaction):
             return
-        self.current_page = 0
+        if not self.pages.is_built(page):
+            # Fetching a new page may take a moment; acknowledge first
+            await interaction.response.defer()
+        embed = await self.pages.get(page, interaction.guild)
+        self.current_page = page
         self.update_buttons()
-        await interaction.response.edit_message(embed=self.pages[self.current_page], view=self)
+        if interaction.response.is_done():
+            await interaction.edit_original_response(embed=embed, view=self)
+        else:
+            await interaction.response.edit_message(embed=embed, view=self)
+    
+    @discord.ui.button(label="⏮️", style=discord.ButtonStyle.gray)
+    async def first_page(self, interaction: discord.Interaction, button: Button):
+        await self._show_page(interaction, 0)
     
     @discord.ui.button(label="◀️", style=discord.ButtonStyle.primary)
     async def prev_page(self, interaction: discord.Interaction, button: Button):
-        if interaction.user.id != self.ctx.author.id:
-            await interaction.response.send_message("Only command user can control this.", ephemeral=True)
-            return
-        self.current_page = max(0, self.current_page - 1)
-        self.update_buttons()
-        await interaction.response.edit_message(embed=self.pages[self.current_page], view=self)
+        await self._show_page(interaction, max(0, self.current_page - 1))
     
     @discord.ui.button(label="▶️", style=discord.ButtonStyle.primary)
     async def next_page(self, interaction: discord.Interaction, button: Button):
-        if interaction.user.id != self.ctx.author.id:
-            await interaction.response.send_message("Only command user can control this.", ephemeral=True)
-            return
-        self.current_page = min(len(self.pages) - 1, self.current_page + 1)
-        self.update_buttons()
-        await interaction.response.edit_message(embed=self.pages[self.current_page], view=self)
+        await self._show_page(interaction, min(len(self.pages) - 1, self.current_page + 1))
     
     @discord.ui.button(label="⏭️", style=discord.ButtonStyle.gray)
     async def last_page(self, interaction: discord.Interaction, button: Button):
-        if interaction.user.id != self.ctx.author.id:
-            await interaction.response.send_message("Only command user can control this.", ephemeral=True)
-            return
-        self.current_page = len(self.pages) - 1
-        self.update_buttons()
-        await interaction.response.edit_message(embed=self.pages[self.current_page], view=self)
+        await self._show_page(interaction, len(self.pages) - 1)
     
     @discord.ui.button(label="🗑️", style=discord.ButtonStyle.danger)
     async def delete_message(self, interaction: discord.Interaction, button: Button):
-        if interaction.user.id != self.ctx.author.id:
-            await interaction.response.send_message("Only command user can delete this.", ephemeral=True)
+        if not await self._guard(interaction, "delete"):
             return
         await interaction.message.delete()
         self.stop()
@@ -661,22 +1073,113 @@ class LeaderboardView(View):
             except:
                 pass
 
-def create_leaderboard_pages(leaderboard: List[tuple], bot: commands.Bot) -> List[discord.Embed]:
-    if not leaderboard:
+# ========================================
+# CONFIRM VIEW
+# ========================================
+
+_CONFIRM_TIMEOUT = discord.Embed(
+    title="⏰ Confirmation Timeout",
+    description="Action cancelled due to timeout",
+    color=discord.Color.orange()
+)
+
+class ConfirmView(View):
+    """Confirm/cancel buttons for destructive owner commands"""
+    
+    def __init__(self, author_id: int, on_confirm: Callable[[], Awaitable[discord.Embed]],
+                 cancel_embed: discord.Embed, timeout_embed: discord.Embed, timeout=30):
+        super().__init__(timeout=timeout)
+        self.author_id = author_id
+        self.on_confirm = on_confirm
+        self.cancel_embed = cancel_embed
+        self.timeout_embed = timeout_embed
+        self.message = None
+    
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message("Only command user can confirm this.", ephemeral=True)
+            return False
+        return True
+    
+    @discord.ui.button(label="Confirm", emoji="✅", style=discord.ButtonStyle.danger)
+    async def confirm(self, interaction: discord.Interaction, button: Button):
+        self.stop()
+        # Acknowledge within Discord's 3s window; the write may take longer
+        await interaction.response.defer()
+        embed = await self.on_confirm()
+        await interaction.edit_original_response(embed=embed, view=None)
+    
+    @discord.ui.button(label="Cancel", emoji="❌", style=discord.ButtonStyle.gray)
+    async def cancel(self, interaction: discord.Interaction, button: Button):
+        self.stop()
+        await interaction.response.edit_message(embed=self.cancel_embed, view=None)
+    
+    async def on_timeout(self):
+        if self.message:
+            try:
+                await self.message.edit(embed=self.timeout_embed, view=None)
+            except:
+                pass
+
+_MEDALS = ("🥇", "🥈", "🥉")
+
+async def resolve_user_names(user_ids: List[int], guild: Optional[discord.Guild]):
+    """Look up uncached users with one member query"""
+    if guild is None:
+        return
+    missing = [user_id for user_id in user_ids if user_display_name(user_id) is None]
+    if not missing:
+        return
+    try:
+        # Keep well inside the 3s window for answering button interactions
+        members = await asyncio.wait_for(
+            guild.query_members(user_ids=missing, limit=len(missing)), timeout=2
+        )
+    except Exception as e:
+        logging.error(f"Error querying members: {e}")
+        return
+    for member in members:
+        remember_user_name(member.id, member.name)
+
+class LeaderboardPages:
+    """Leaderboard embeds, each page fetched and built the first time it is shown"""
+    __slots__ = ('total', 'total_pages', '_built')
+    
+    def __init__(self, total: int):
+        self.total = total
+        self.total_pages = max(1, (total + Config.LEADERBOARD_PER_PAGE - 1) // Config.LEADERBOARD_PER_PAGE)
+        self._built: Dict[int, discord.Embed] = {}
+    
+    def __len__(self) -> int:
+        return self.total_pages
+    
+    def is_built(self, page_num: int) -> bool:
+        return page_num in self._built
+    
+    async def get(self, page_num: int, guild: Optional[discord.Guild]) -> discord.Embed:
+        page_num = min(max(page_num, 0), self.total_pages - 1)
+        embed = self._built.get(page_num)
+        if embed is None:
+            start_idx = page_num * Config.LEADERBOARD_PER_PAGE
+            page_data = await db.get_leaderboard_page(start_idx, Config.LEADERBOARD_PER_PAGE)
+            if not page_data:
+                # Rows went away since counting, or the query failed; don't keep this page
+                return self._build_empty(page_num)
+            await resolve_user_names([user_id for user_id, _ in page_data], guild)
+            embed = self._built[page_num] = self._build(page_num, page_data)
+        return embed
+    
+    def _build_empty(self, page_num: int) -> discord.Embed:
         embed = discord.Embed(
             title="📊 Reputation Leaderboard",
-            description="No reputation data yet. Start vouching!",
-            color=discord.Color.blue()
+            description=f"No entries on this page right now. Run `{Config.PREFIX}leaderboard` again.",
+            color=discord.Color.gold()
         )
-        return [embed]
+        embed.set_footer(text=f"Page {page_num + 1}/{self.total_pages}")
+        return embed
     
-    pages = []
-    total_pages = (len(leaderboard) + Config.LEADERBOARD_PER_PAGE - 1) // Config.LEADERBOARD_PER_PAGE
-    
-    for page_num in range(total_pages):
+    def _build(self, page_num: int, page_data: List[tuple]) -> discord.Embed:
         start_idx = page_num * Config.LEADERBOARD_PER_PAGE
-        end_idx = start_idx + Config.LEADERBOARD_PER_PAGE
-        page_data = leaderboard[start_idx:end_idx]
         
         embed = discord.Embed(
             title="📊 Reputation Leaderboard",
@@ -684,33 +1187,23 @@ def create_leaderboard_pages(leaderboard: List[tuple], bot: commands.Bot) -> Lis
             color=discord.Color.gold()
         )
         
-        leaderboard_text = []
-        for idx, (user_id, rep) in enumerate(page_data, start=start_idx + 1):
-            user = bot.get_user(user_id)
-            
-            if idx == 1:
-                medal = "🥇"
-            elif idx == 2:
-                medal = "🥈"
-            elif idx == 3:
-                medal = "🥉"
-            else:
-                medal = f"`#{idx}`"
-            
-            user_name = user.name if user else f"Unknown User"
-            leaderboard_text.append(f"{medal} **{user_name}** - {rep} rep")
+        leaderboard_text = "\n".join(
+            f"{_MEDALS[idx - 1] if idx <= 3 else f'`#{idx}`'} "
+            f"**{user_display_name(user_id) or 'Unknown User'}** - {rep} rep"
+            for idx, (user_id, rep) in enumerate(page_data, start=start_idx + 1)
+        )
         
         embed.add_field(
             name=f"Rankings {start_idx + 1}-{start_idx + len(page_data)}",
-            value="\n".join(leaderboard_text),
+            value=leaderboard_text,
             inline=False
         )
         
-        embed.set_footer(text=f"Page {page_num + 1}/{total_pages} | Total: {len(leaderboard)}")
-        
-        pages.append(embed)
-    
-    return pages
+        embed.set_footer(text=f"Page {page_num + 1}/{self.total_pages} | Total: {self.total}")
+        return embed
+
+# (rep_version, built_at, pages); rebuilt after a rep write or LEADERBOARD_CACHE_TTL
+_leaderboard_pages = (None, 0.0, None)
 
 # ========================================
 # BASIC COMMANDS
@@ -719,9 +1212,11 @@ def create_leaderboard_pages(leaderboard: List[tuple], bot: commands.Bot) -> Lis
 @bot.command(name='leaderboard', aliases=['lb', 'top'])
 async def leaderboard_cmd(ctx):
     """View reputation leaderboard"""
-    leaderboard = db.get_leaderboard()
+    global _leaderboard_pages
+    version = db.rep_version
+    total = await db.get_leaderboard_count()
     
-    if not leaderboard:
+    if not total:
         embed = discord.Embed(
             title="📊 Reputation Leaderboard",
             description="No reputation data yet. Use `!vouch @user reason` to give reputation!",
@@ -730,27 +1225,28 @@ async def leaderboard_cmd(ctx):
         await ctx.send(embed=embed)
         return
     
-    pages = create_leaderboard_pages(leaderboard, bot)
+    cached_version, built_at, pages = _leaderboard_pages
+    now = time.monotonic()
+    if (cached_version != version or pages.total != total
+            or now - built_at >= Config.LEADERBOARD_CACHE_TTL):
+        pages = LeaderboardPages(total)
+        _leaderboard_pages = (version, now, pages)
+    embed = await pages.get(0, ctx.guild)
     
     if len(pages) == 1:
-        await ctx.send(embed=pages[0])
+        await ctx.send(embed=embed)
     else:
         view = LeaderboardView(ctx, pages)
-        view.message = await ctx.send(embed=pages[0], view=view)
+        view.message = await ctx.send(embed=embed, view=view)
 
 @bot.command(name='rank', aliases=['rep', 'reputation'])
 async def rank_cmd(ctx, member: discord.Member = None):
     """Check reputation"""
     member = member or ctx.author
     
-    rep = db.get_reputation(member.id)
-    leaderboard = db.get_leaderboard()
-    
-    rank = None
-    for idx, (user_id, _) in enumerate(leaderboard, 1):
-        if user_id == member.id:
-            rank = idx
-            break
+    rep = await db.get_reputation(member.id)
+    rank = await db.get_user_rank(member.id, rep)
+    total_users = await db.get_leaderboard_count()
     
     embed = discord.Embed(
         title=f"{member.display_name}'s Reputation",
@@ -760,14 +1256,13 @@ async def rank_cmd(ctx, member: discord.Member = None):
     
     embed.add_field(name="Reputation", value=f"⭐ {rep}", inline=True)
     embed.add_field(name="Rank", value=f"#{rank}" if rank else "Unranked", inline=True)
-    embed.add_field(name="Total Users", value=str(len(leaderboard)), inline=True)
+    embed.add_field(name="Total Users", value=str(total_users), inline=True)
     
-    recent_vouches = db.get_vouch_history(member.id, limit=5)
+    recent_vouches = await db.get_vouch_history(member.id, limit=5)
     if recent_vouches:
         vouch_text = []
         for vouch in recent_vouches:
-            voucher = bot.get_user(vouch['voucher'])
-            voucher_name = voucher.name if voucher else "Unknown"
+            voucher_name = user_display_name(vouch['voucher']) or "Unknown"
             vouch_text.append(f"**{voucher_name}**: {vouch['reason']}")
         
         embed.add_field(
@@ -782,7 +1277,7 @@ async def rank_cmd(ctx, member: discord.Member = None):
 @bot.command(name='cooldown', aliases=['cd'])
 async def cooldown_cmd(ctx):
     """Check vouch cooldown"""
-    cooldown = db.get_vouch_cooldown(ctx.author.id)
+    cooldown = await db.get_vouch_cooldown(ctx.author.id)
     
     embed = discord.Embed(
         title="⏰ Vouch Cooldown",
@@ -801,7 +1296,7 @@ async def cooldown_cmd(ctx):
         embed.description = f"You can vouch again in **{time_remaining}**"
         embed.add_field(
             name="Cooldown Duration",
-            value=f"{Config.VOUCH_COOLDOWN // 60} minutes",
+            value=_COOLDOWN_LENGTH_LABEL,
             inline=False
         )
     
@@ -812,58 +1307,64 @@ async def cooldown_cmd(ctx):
 # VOUCH COMMAND
 # ========================================
 
+_ERR_VOUCH_BLACKLISTED = discord.Embed(
+    title="🚫 You Are Blacklisted",
+    description="You have been blacklisted from using the vouch command.",
+    color=discord.Color.red()
+)
+
+_ERR_VOUCH_REASON = discord.Embed(
+    title="⚠️ Vouch Reason Required",
+    description=(
+        "You must provide a valid reason when vouching for someone.\n\n"
+        "**Proper Usage:**\n"
+        "`!vouch @user reason for vouching`\n\n"
+        "**Examples:**\n"
+        "✅ `!vouch @John Great trader, smooth deal!`\n"
+        "✅ `!vouch @Sarah Trustworthy and fast service`\n"
+        "❌ `!vouch @Mike`\n"
+        "❌ `!vouch @Alex good`\n\n"
+        "⚠️ **WARNING:** Vouching without a valid reason will result in punishment."
+    ),
+    color=discord.Color.red()
+)
+
+_ERR_SELF_VOUCH = discord.Embed(
+    title="❌ Cannot Vouch Yourself",
+    description="You cannot vouch for yourself!",
+    color=discord.Color.red()
+)
+
+_ERR_BOT_VOUCH = discord.Embed(
+    title="❌ Cannot Vouch Bots",
+    description="You cannot vouch for bots!",
+    color=discord.Color.red()
+)
+
 @bot.command(name='vouch')
 async def vouch_cmd(ctx, member: discord.Member, *, reason: str = None):
     """Vouch for a user and give them reputation"""
+    author = ctx.author
+    author_id = author.id
     
     # Check if blacklisted
-    if db.is_blacklisted(ctx.author.id):
-        embed = discord.Embed(
-            title="🚫 You Are Blacklisted",
-            description="You have been blacklisted from using the vouch command.",
-            color=discord.Color.red()
-        )
-        await ctx.send(embed=embed)
+    if await db.is_blacklisted(author_id):
+        await ctx.send(embed=_ERR_VOUCH_BLACKLISTED)
         return
     
     if not reason or len(reason.strip()) < 3:
-        disclaimer_embed = discord.Embed(
-            title="⚠️ Vouch Reason Required",
-            description=(
-                "You must provide a valid reason when vouching for someone.\n\n"
-                "**Proper Usage:**\n"
-                "`!vouch @user reason for vouching`\n\n"
-                "**Examples:**\n"
-                "✅ `!vouch @John Great trader, smooth deal!`\n"
-                "✅ `!vouch @Sarah Trustworthy and fast service`\n"
-                "❌ `!vouch @Mike`\n"
-                "❌ `!vouch @Alex good`\n\n"
-                "⚠️ **WARNING:** Vouching without a valid reason will result in punishment."
-            ),
-            color=discord.Color.red()
-        )
-        await ctx.send(embed=disclaimer_embed)
+        await ctx.send(embed=_ERR_VOUCH_REASON)
         return
     
-    if member.id == ctx.author.id:
-        embed = discord.Embed(
-            title="❌ Cannot Vouch Yourself",
-            description="You cannot vouch for yourself!",
-            color=discord.Color.red()
-        )
-        await ctx.send(embed=embed)
+    if member.id == author_id:
+        await ctx.send(embed=_ERR_SELF_VOUCH)
         return
     
     if member.bot:
-        embed = discord.Embed(
-            title="❌ Cannot Vouch Bots",
-            description="You cannot vouch for bots!",
-            color=discord.Color.red()
-        )
-        await ctx.send(embed=embed)
+        await ctx.send(embed=_ERR_BOT_VOUCH)
         return
     
-    cooldown = db.get_vouch_cooldown(ctx.author.id)
+    cooldown = await db.get_vouch_cooldown(author_id)
     if cooldown is not None:
         time_remaining = format_time(cooldown)
         
@@ -874,58 +1375,50 @@ async def vouch_cmd(ctx, member: discord.Member, *, reason: str = None):
         )
         embed.add_field(
             name="Cooldown",
-            value=f"You can vouch once every {Config.VOUCH_COOLDOWN // 60} minutes",
+            value=_COOLDOWN_RULE_LABEL,
             inline=False
         )
-        embed.set_footer(text=f"Requested by {ctx.author.name}")
+        embed.set_footer(text=f"Requested by {author.name}")
         await ctx.send(embed=embed)
         return
     
     # Add reputation and vouch
-    db.add_reputation(member.id, Config.VOUCH_REP_AMOUNT)
-    db.add_vouch(member.id, ctx.author.id, reason)
-    
-    new_rep = db.get_reputation(member.id)
-    
-    embed = discord.Embed(
-        title="✅ Vouch Successful",
-        description=f"{ctx.author.mention} vouched for {member.mention}",
-        color=discord.Color.green()
-    )
-    
-    embed.add_field(name="Reason", value=reason, inline=False)
-    embed.add_field(name="Reputation Given", value=f"+{Config.VOUCH_REP_AMOUNT} ⭐", inline=True)
-    embed.add_field(name="New Total", value=f"{new_rep} ⭐", inline=True)
-    embed.add_field(
-        name="Next Vouch",
-        value=f"Available in {Config.VOUCH_COOLDOWN // 60} minutes",
-        inline=False
-    )
-    
-    embed.set_thumbnail(url=member.display_avatar.url)
-    embed.set_footer(text=f"Vouched by {ctx.author.name}")
+    new_rep = await db.add_vouch(member.id, author_id, reason, member.name)
+    
+    embed = discord.Embed.from_dict({
+        'title': "✅ Vouch Successful",
+        'description': f"{author.mention} vouched for {member.mention}",
+        'color': discord.Color.green().value,
+        'fields': [
+            {'name': "Reason", 'value': reason, 'inline': False},
+            {'name': "Reputation Given", 'value': _VOUCH_GAIN_LABEL, 'inline': True},
+            {'name': "New Total", 'value': f"{new_rep} ⭐", 'inline': True},
+            {'name': "Next Vouch", 'value': _NEXT_VOUCH_LABEL, 'inline': False},
+        ],
+        'thumbnail': {'url': member.display_avatar.url},
+        'footer': {'text': f"Vouched by {author.name}"},
+    })
     await ctx.send(embed=embed)
     
-    # Try to DM the user
-    try:
-        dm_embed = discord.Embed(
-            title="🎉 You Received a Vouch!",
-            description=f"**{ctx.author.name}** vouched for you in **{ctx.guild.name}**",
-            color=discord.Color.gold()
-        )
-        dm_embed.add_field(name="Reason", value=reason, inline=False)
-        dm_embed.add_field(name="Reputation Gained", value=f"+{Config.VOUCH_REP_AMOUNT} ⭐", inline=True)
-        dm_embed.add_field(name="Total Reputation", value=f"{new_rep} ⭐", inline=True)
-        await member.send(embed=dm_embed)
-    except:
-        pass
+    # DM the user without holding up the command
+    dm_embed = discord.Embed.from_dict({
+        'title': "🎉 You Received a Vouch!",
+        'description': f"**{author.name}** vouched for you in **{ctx.guild.name}**",
+        'color': discord.Color.gold().value,
+        'fields': [
+            {'name': "Reason", 'value': reason, 'inline': False},
+            {'name': "Reputation Gained", 'value': _VOUCH_GAIN_LABEL, 'inline': True},
+            {'name': "Total Reputation", 'value': f"{new_rep} ⭐", 'inline': True},
+        ],
+    })
+    send_dm_in_background(member, dm_embed)
 
 @bot.command(name='vouchhistory', aliases=['vh', 'vouches'])
 async def vouch_history_cmd(ctx, member: discord.Member = None):
     """View vouch history for a user"""
     member = member or ctx.author
     
-    vouches = db.get_vouch_history(member.id, limit=10)
+    vouches = await db.get_vouch_history(member.id, limit=10)
     
     if not vouches:
         embed = discord.Embed(
@@ -937,24 +1430,22 @@ async def vouch_history_cmd(ctx, member: discord.Member = None):
         await ctx.send(embed=embed)
         return
     
+    lines = [
+        f"**#{idx} {user_display_name(vouch['voucher']) or 'Unknown User'}** — "
+        f"{clip(vouch['reason'])} (+{vouch['rep_amount']} ⭐)"
+        for idx, vouch in enumerate(vouches, 1)
+    ]
+    header = f"Showing last {len(vouches)} vouches\n\n"
+    value, _ = join_field_lines(lines, DESCRIPTION_LIMIT - len(header))
+    
     embed = discord.Embed(
         title=f"{member.display_name}'s Vouch History",
-        description=f"Showing last {len(vouches)} vouches",
+        description=header + value,
         color=discord.Color.blue()
     )
     embed.set_thumbnail(url=member.display_avatar.url)
     
-    for idx, vouch in enumerate(vouches, 1):
-        voucher = bot.get_user(vouch['voucher'])
-        voucher_name = voucher.name if voucher else "Unknown User"
-        
-        embed.add_field(
-            name=f"Vouch #{idx} - {voucher_name}",
-            value=f"**Reason:** {vouch['reason']}\n**Rep Given:** +{vouch['rep_amount']} ⭐",
-            inline=False
-        )
-    
-    total_rep = db.get_reputation(member.id)
+    total_rep = await db.get_reputation(member.id)
     embed.set_footer(text=f"Total Reputation: {total_rep} ⭐")
     await ctx.send(embed=embed)
 
@@ -962,142 +1453,147 @@ async def vouch_history_cmd(ctx, member: discord.Member = None):
 # DUMMY COMMAND
 # ========================================
 
+# Static error embeds (shared). Embed.copy() still shares the fields list, so a copy may
+# only get a footer/description/thumbnail; never add_field on one.
+_ERR_DUMMY_BLACKLISTED = discord.Embed(
+    title="🚫 You Are Blacklisted",
+    description="You have been blacklisted and cannot use the dummy command.",
+    color=discord.Color.red()
+)
+
+_ERR_DUMMY_LIMIT = discord.Embed(
+    title="❌ Daily Limit Reached",
+    description=f"You have used all {Config.DUMMY_PER_DAY} dummy commands for today.",
+    color=discord.Color.red()
+).add_field(
+    name="Reset Time",
+    value="Resets at 00:00 UTC",
+    inline=False
+)
+
+_ERR_SELF_DUMMY = discord.Embed(
+    title="❌ Cannot Dummy Yourself",
+    description="You cannot use dummy on yourself!",
+    color=discord.Color.red()
+)
+
+_ERR_BOT_DUMMY = discord.Embed(
+    title="❌ Cannot Dummy Bots",
+    description="You cannot use dummy on bots!",
+    color=discord.Color.red()
+)
+
 @bot.command(name='dummy')
 async def dummy_cmd(ctx, member: discord.Member):
     """Remove 3 rep from a user (3 times per day limit)"""
+    author = ctx.author
+    author_id = author.id
 
  # ADD THIS NEW CHECK HERE 
     
-    if db.is_blacklisted(ctx.author.id):
-        embed = discord.Embed(
-            title="🚫 You Are Blacklisted",
-            description="You have been blacklisted and cannot use the dummy command.",
-            color=discord.Color.red()
-        )
-        await ctx.send(embed=embed)
+    if await db.is_blacklisted(author_id):
+        await ctx.send(embed=_ERR_DUMMY_BLACKLISTED)
         return
         
     # END OF NEW CHECK 
     
-    can_use, remaining = db.can_use_dummy(ctx.author.id)
+    can_use, remaining = await db.can_use_dummy(author_id)
     
     if not can_use:
-        embed = discord.Embed(
-            title="❌ Daily Limit Reached",
-            description=f"You have used all {Config.DUMMY_PER_DAY} dummy commands for today.",
-            color=discord.Color.red()
-        )
-        embed.add_field(
-            name="Reset Time",
-            value="Resets at 00:00 UTC",
-            inline=False
-        )
-        embed.set_footer(text=f"Requested by {ctx.author.name}")
+        embed = _ERR_DUMMY_LIMIT.copy()
+        embed.set_footer(text=f"Requested by {author.name}")
         await ctx.send(embed=embed)
         return
     
-    if member.id == ctx.author.id:
-        embed = discord.Embed(
-            title="❌ Cannot Dummy Yourself",
-            description="You cannot use dummy on yourself!",
-            color=discord.Color.red()
-        )
-        await ctx.send(embed=embed)
+    if member.id == author_id:
+        await ctx.send(embed=_ERR_SELF_DUMMY)
         return
     
     if member.bot:
-        embed = discord.Embed(
-            title="❌ Cannot Dummy Bots",
-            description="You cannot use dummy on bots!",
-            color=discord.Color.red()
-        )
-        await ctx.send(embed=embed)
+        await ctx.send(embed=_ERR_BOT_DUMMY)
         return
     
-    old_rep = db.get_reputation(member.id)
-    db.remove_reputation(member.id, Config.DUMMY_REP_REMOVE)
-    db.use_dummy(ctx.author.id)
-    new_rep = db.get_reputation(member.id)
-    
-    embed = discord.Embed(
-        title="💥 Dummy Used",
-        description=f"{ctx.author.mention} used dummy on {member.mention}",
-        color=discord.Color.orange()
+    old_rep, new_rep, remaining = await db.apply_dummy(
+        member.id, author_id, Config.DUMMY_REP_REMOVE
     )
     
-    embed.add_field(name="Previous Rep", value=f"{old_rep} ⭐", inline=True)
-    embed.add_field(name="Removed", value=f"-{Config.DUMMY_REP_REMOVE} ⭐", inline=True)
-    embed.add_field(name="New Total", value=f"{new_rep} ⭐", inline=True)
-    embed.add_field(
-        name="Remaining Uses Today",
-        value=f"{remaining - 1}/{Config.DUMMY_PER_DAY}",
-        inline=False
-    )
-    
-    embed.set_thumbnail(url=member.display_avatar.url)
-    embed.set_footer(text=f"Used by {ctx.author.name}")
+    embed = discord.Embed.from_dict({
+        'title': "💥 Dummy Used",
+        'description': f"{author.mention} used dummy on {member.mention}",
+        'color': discord.Color.orange().value,
+        'fields': [
+            {'name': "Previous Rep", 'value': f"{old_rep} ⭐", 'inline': True},
+            {'name': "Removed", 'value': _DUMMY_LOSS_LABEL, 'inline': True},
+            {'name': "New Total", 'value': f"{new_rep} ⭐", 'inline': True},
+            {
+                'name': "Remaining Uses Today",
+                'value': f"{remaining}/{Config.DUMMY_PER_DAY}",
+                'inline': False
+            },
+        ],
+        'thumbnail': {'url': member.display_avatar.url},
+        'footer': {'text': f"Used by {author.name}"},
+    })
     await ctx.send(embed=embed)
 
 # ========================================
 # HELPVOUCH COMMAND
 # ========================================
 
+_ERR_SELF_HELPVOUCH = discord.Embed(
+    title="❌ Cannot Helpvouch Yourself",
+    description="You cannot helpvouch yourself!",
+    color=discord.Color.red()
+)
+
+_ERR_BOT_HELPVOUCH = discord.Embed(
+    title="❌ Cannot Helpvouch Bots",
+    description="You cannot helpvouch bots!",
+    color=discord.Color.red()
+)
+
+# (field name, field value) indexed by is_staff
+_HELPVOUCH_TEXT = (
+    ("ℹ️ Member Helpvouch",
+     f"You gave **{Config.HELPVOUCH_REP_MEMBER} ⭐** (Staff members give {Config.HELPVOUCH_REP_STAFF} ⭐)"),
+    ("🛡️ Staff Bonus",
+     f"Staff members give **{Config.HELPVOUCH_REP_STAFF} ⭐** (Regular members give {Config.HELPVOUCH_REP_MEMBER} ⭐)")
+)
+
 @bot.command(name='helpvouch', aliases=['hv'])
 async def helpvouch_cmd(ctx, member: discord.Member):
     """Give reputation (Staff: 2 rep | Members: 1 rep)"""
+    author = ctx.author
+    author_id = author.id
     
-    if member.id == ctx.author.id:
-        embed = discord.Embed(
-            title="❌ Cannot Helpvouch Yourself",
-            description="You cannot helpvouch yourself!",
-            color=discord.Color.red()
-        )
-        await ctx.send(embed=embed)
+    if member.id == author_id:
+        await ctx.send(embed=_ERR_SELF_HELPVOUCH)
         return
     
     if member.bot:
-        embed = discord.Embed(
-            title="❌ Cannot Helpvouch Bots",
-            description="You cannot helpvouch bots!",
-            color=discord.Color.red()
-        )
-        await ctx.send(embed=embed)
+        await ctx.send(embed=_ERR_BOT_HELPVOUCH)
         return
     
     # Check if user has staff role
-    is_staff = has_staff_role(ctx.author)
+    is_staff = has_staff_role(author)
     rep_amount = Config.HELPVOUCH_REP_STAFF if is_staff else Config.HELPVOUCH_REP_MEMBER
     
-    old_rep = db.get_reputation(member.id)
-    db.add_reputation(member.id, rep_amount)
-    db.add_helpvouch(member.id, ctx.author.id, rep_amount)
-    new_rep = db.get_reputation(member.id)
-    
-    embed = discord.Embed(
-        title="✅ Helpvouch Successful",
-        description=f"{ctx.author.mention} helped {member.mention}",
-        color=discord.Color.green()
-    )
-    
-    if is_staff:
-        embed.add_field(
-            name="🛡️ Staff Bonus",
-            value=f"Staff members give **{Config.HELPVOUCH_REP_STAFF} ⭐** (Regular members give {Config.HELPVOUCH_REP_MEMBER} ⭐)",
-            inline=False
-        )
-    else:
-        embed.add_field(
-            name="ℹ️ Member Helpvouch",
-            value=f"You gave **{Config.HELPVOUCH_REP_MEMBER} ⭐** (Staff members give {Config.HELPVOUCH_REP_STAFF} ⭐)",
-            inline=False
-        )
-    
-    embed.add_field(name="Previous Rep", value=f"{old_rep} ⭐", inline=True)
-    embed.add_field(name="Added", value=f"+{rep_amount} ⭐", inline=True)
-    embed.add_field(name="New Total", value=f"{new_rep} ⭐", inline=True)
-    
-    embed.set_thumbnail(url=member.display_avatar.url)
-    embed.set_footer(text=f"Helped by {ctx.author.name}")
+    old_rep, new_rep = await db.apply_helpvouch(member.id, author_id, rep_amount, member.name)
+    
+    bonus_name, bonus_value = _HELPVOUCH_TEXT[is_staff]
+    embed = discord.Embed.from_dict({
+        'title': "✅ Helpvouch Successful",
+        'description': f"{author.mention} helped {member.mention}",
+        'color': discord.Color.green().value,
+        'fields': [
+            {'name': bonus_name, 'value': bonus_value, 'inline': False},
+            {'name': "Previous Rep", 'value': f"{old_rep} ⭐", 'inline': True},
+            {'name': "Added", 'value': f"+{rep_amount} ⭐", 'inline': True},
+            {'name': "New Total", 'value': f"{new_rep} ⭐", 'inline': True},
+        ],
+        'thumbnail': {'url': member.display_avatar.url},
+        'footer': {'text': f"Helped by {author.name}"},
+    })
     await ctx.send(embed=embed)
 
 # ========================================
@@ -1109,8 +1605,8 @@ async def helpvouch_cmd(ctx, member: discord.Member):
 async def repblacklist_cmd(ctx, member: discord.Member):
     """Blacklist/unblacklist a user from using vouch (Owner only)"""
     
-    if db.is_blacklisted(member.id):
-        db.remove_from_blacklist(member.id)
+    if await db.is_blacklisted(member.id):
+        await db.remove_from_blacklist(member.id)
         
         embed = discord.Embed(
             title="✅ User Unblacklisted",
@@ -1123,7 +1619,7 @@ async def repblacklist_cmd(ctx, member: discord.Member):
         await ctx.send(embed=embed)
         logging.info(f"Owner {ctx.author.name} unblacklisted {member.name}")
     else:
-        db.add_to_blacklist(member.id)
+        await db.add_to_blacklist(member.id)
         
         embed = discord.Embed(
             title="🚫 User Blacklisted",
@@ -1136,11 +1632,15 @@ async def repblacklist_cmd(ctx, member: discord.Member):
         await ctx.send(embed=embed)
         logging.info(f"Owner {ctx.author.name} blacklisted {member.name}")
 
+# Rendered blacklist field text, keyed by db.blacklist_version
+_blacklist_render = (None, "")
+
 @bot.command(name='viewblacklist', aliases=['vbl'])
 @is_owner()
 async def viewblacklist_cmd(ctx):
     """View all blacklisted users (Owner only)"""
-    blacklist = db.get_blacklist()
+    global _blacklist_render
+    blacklist = await db.get_blacklist()
     
     if not blacklist:
         embed = discord.Embed(
@@ -1157,15 +1657,25 @@ async def viewblacklist_cmd(ctx):
         color=discord.Color.red()
     )
     
-    blacklist_text = []
-    for user_id in blacklist:
-        user = bot.get_user(user_id)
-        user_name = user.name if user else f"Unknown User ({user_id})"
-        blacklist_text.append(f"• {user_name}")
+    version, blacklist_text = _blacklist_render
+    if version != db.blacklist_version:
+        lines = []
+        resolved = True
+        for user_id in blacklist[:25]:
+            name = user_display_name(user_id)
+            if name:
+                lines.append(f"• {name}")
+            else:
+                lines.append(f"• Unknown User ({user_id})")
+                resolved = False
+        blacklist_text = "\n".join(lines)
+        # Retry unresolved names next time in case the user cache fills in
+        if resolved:
+            _blacklist_render = (db.blacklist_version, blacklist_text)
     
     embed.add_field(
         name="Blacklisted Users",
-        value="\n".join(blacklist_text[:25]),
+        value=blacklist_text,
         inline=False
     )
     
@@ -1200,6 +1710,36 @@ def is_staff():
 # FIND the applyscammer command (around line 1240-1290)
 # REPLACE the entire embed section with this CORRECTLY INDENTED version:
 
+_ERR_SCAMMER_REASON = discord.Embed(
+    title="⚠️ Reason Required",
+    description="You must provide a detailed reason when reporting a scammer.",
+    color=discord.Color.red()
+).add_field(
+    name="Usage",
+    value=f"`{Config.PREFIX}applyscammer @user detailed reason here`\n"
+          f"`{Config.PREFIX}applyscammer username detailed reason here`\n"
+          f"`{Config.PREFIX}applyscammer 123456789 detailed reason here`",
+    inline=False
+).add_field(
+    name="Examples",
+    value=f"`{Config.PREFIX}applyscammer @John He scammed me for $50`\n"
+          f"`{Config.PREFIX}applyscammer FartBlox123 Scammed multiple people on TikTok`\n"
+          f"`{Config.PREFIX}applyscammer ScammerYT Known YouTube scammer`",
+    inline=False
+)
+
+_ERR_SELF_REPORT = discord.Embed(
+    title="❌ Cannot Report Yourself",
+    description="You cannot report yourself as a scammer!",
+    color=discord.Color.red()
+)
+
+_ERR_BOT_REPORT = discord.Embed(
+    title="❌ Cannot Report Bots",
+    description="You cannot report bots as scammers!",
+    color=discord.Color.red()
+)
+
 @bot.command(name='applyscammer', aliases=['reportscammer', 'addscammer'])
 @is_staff()
 async def applyscammer_cmd(ctx, user_input: str, *, reason: str = None):
@@ -1248,54 +1788,21 @@ async def applyscammer_cmd(ctx, user_input: str, *, reason: str = None):
     
     # Check if reason is provided
     if not reason or len(reason.strip()) < 5:
-        embed = discord.Embed(
-            title="⚠️ Reason Required",
-            description="You must provide a detailed reason when reporting a scammer.",
-            color=discord.Color.red()
-        )
-        embed.add_field(
-            name="Usage",
-            value=f"`{Config.PREFIX}applyscammer @user detailed reason here`\n"
-                  f"`{Config.PREFIX}applyscammer username detailed reason here`\n"
-                  f"`{Config.PREFIX}applyscammer 123456789 detailed reason here`",
-            inline=False
-        )
-        embed.add_field(
-            name="Examples",
-            value=f"`{Config.PREFIX}applyscammer @John He scammed me for $50`\n"
-                  f"`{Config.PREFIX}applyscammer FartBlox123 Scammed multiple people on TikTok`\n"
-                  f"`{Config.PREFIX}applyscammer ScammerYT Known YouTube scammer`",
-            inline=False
-        )
-        await ctx.send(embed=embed)
+        await ctx.send(embed=_ERR_SCAMMER_REASON)
         return
     
     # Prevent self-reporting
     if user_id == ctx.author.id:
-        embed = discord.Embed(
-            title="❌ Cannot Report Yourself",
-            description="You cannot report yourself as a scammer!",
-            color=discord.Color.red()
-        )
-        await ctx.send(embed=embed)
+        await ctx.send(embed=_ERR_SELF_REPORT)
         return
     
     # Prevent bot reporting
     if member and member.bot:
-        embed = discord.Embed(
-            title="❌ Cannot Report Bots",
-            description="You cannot report bots as scammers!",
-            color=discord.Color.red()
-        )
-        await ctx.send(embed=embed)
+        await ctx.send(embed=_ERR_BOT_REPORT)
         return
     
     # Add scammer report to database
-    db.add_scammer_report(user_id, ctx.author.id, reason)
-    
-    # Get total reports for this user
-    reports = db.get_scammer_reports(user_id)
-    total_reports = len(reports)
+    report_id, total_reports = await db.add_scammer_report(user_id, ctx.author.id, reason)
     
     # Create success embed
     embed = discord.Embed(
@@ -1318,7 +1825,7 @@ async def applyscammer_cmd(ctx, user_input: str, *, reason: str = None):
     elif member and hasattr(member, 'avatar'):
         embed.set_thumbnail(url=member.avatar.url)
     
-    embed.set_footer(text=f"Report ID: {reports[0]['id']} | Reported by {ctx.author.name}")
+    embed.set_footer(text=f"Report ID: {report_id} | Reported by {ctx.author.name}")
     await ctx.send(embed=embed)
     
     logging.info(f"Staff {ctx.author.name} reported {user_name} (ID: {user_id}) as scammer")
@@ -1364,7 +1871,7 @@ async def scam_cmd(ctx, *, user_input: str):
         await ctx.send("❌ Invalid user input.")
         return
     
-    reports = db.get_scammer_reports(user_id)
+    reports = await db.get_scammer_reports(user_id)
     
     if not reports:
         embed = discord.Embed(
@@ -1378,30 +1885,24 @@ async def scam_cmd(ctx, *, user_input: str):
         await ctx.send(embed=embed)
         return
     
-    # User has scammer reports
+    # Reports go in the description: 4096 characters, and no 25-field cap
+    header = f"**{user_name}** has been reported as a scammer!\n\n"
+    lines = [
+        f"🚩 **#{idx}** by {user_display_name(report['reporter']) or 'Unknown Staff'} "
+        f"({report['time_str']}, ID `{report['id']}`): {clip(report['reason'])}"
+        for idx, report in enumerate(reports, 1)
+    ]
+    value, _ = join_field_lines(lines, DESCRIPTION_LIMIT - len(header))
+    
     embed = discord.Embed(
         title="🚨 SCAMMER ALERT 🚨",
-        description=f"**{user_name}** has been reported as a scammer!",
+        description=header + value,
         color=discord.Color.dark_red()
     )
     
     if member and hasattr(member, 'display_avatar'):
         embed.set_thumbnail(url=member.display_avatar.url)
     
-    # Add each report
-    for idx, report in enumerate(reports, 1):
-        reporter = bot.get_user(report['reporter'])
-        reporter_name = reporter.name if reporter else "Unknown Staff"
-        
-        timestamp = datetime.fromisoformat(report['timestamp'])
-        time_str = timestamp.strftime('%Y-%m-%d %H:%M UTC')
-        
-        embed.add_field(
-            name=f"🚩 Report #{idx} - By {reporter_name}",
-            value=f"**Reason:** {report['reason']}\n**Date:** {time_str}\n**Report ID:** `{report['id']}`",
-            inline=False
-        )
-    
     embed.add_field(
         name="⚠️ WARNING",
         value=f"This user has **{len(reports)} scammer report(s)**. Exercise extreme caution!",
@@ -1452,7 +1953,7 @@ async def removescammer_cmd(ctx, user_input: str, report_id: int = None):
         await ctx.send("❌ Invalid user input.")
         return
     
-    reports = db.get_scammer_reports(user_id)
+    reports = await db.get_scammer_reports(user_id)
     
     if not reports:
         embed = discord.Embed(
@@ -1472,8 +1973,7 @@ async def removescammer_cmd(ctx, user_input: str, report_id: int = None):
         )
         
         for idx, report in enumerate(reports, 1):
-            reporter = bot.get_user(report['reporter'])
-            reporter_name = reporter.name if reporter else "Unknown"
+            reporter_name = user_display_name(report['reporter']) or "Unknown"
             
             embed.add_field(
                 name=f"Report #{idx} - ID: {report['id']}",
@@ -1510,7 +2010,7 @@ async def removescammer_cmd(ctx, user_input: str, report_id: int = None):
         return
     
     # Remove the report
-    db.remove_scammer_report(report_id)
+    await db.remove_scammer_report(report_id)
     
     remaining_reports = len(reports) - 1
     
@@ -1535,6 +2035,12 @@ async def removescammer_cmd(ctx, user_input: str, report_id: int = None):
 # PART 4: Replace !clearallscam command (line ~1420)
 # ========================================
 
+_CLEARALLSCAM_CANCELLED = discord.Embed(
+    title="❌ Action Cancelled",
+    description="Clear all reports cancelled",
+    color=discord.Color.blue()
+)
+
 @bot.command(name='clearallscam', aliases=['clearscammer'])
 @is_staff()
 async def clearallscam_cmd(ctx, *, user_input: str):
@@ -1570,9 +2076,9 @@ async def clearallscam_cmd(ctx, *, user_input: str):
         await ctx.send("❌ Invalid user input.")
         return
     
-    reports = db.get_scammer_reports(user_id)
+    report_count = await db.count_scammer_reports(user_id)
     
-    if not reports:
+    if not report_count:
         embed = discord.Embed(
             title="❌ No Reports Found",
             description=f"**{user_name}** has no scammer reports to clear.",
@@ -1581,8 +2087,6 @@ async def clearallscam_cmd(ctx, *, user_input: str):
         await ctx.send(embed=embed)
         return
     
-    report_count = len(reports)
-    
     # Confirmation
     confirm_embed = discord.Embed(
         title="⚠️ Confirm Clear All Reports",
@@ -1592,53 +2096,27 @@ async def clearallscam_cmd(ctx, *, user_input: str):
     confirm_embed.add_field(name="Reports to Clear", value=f"{report_count} 🚩", inline=True)
     confirm_embed.add_field(
         name="Confirmation",
-        value="React with ✅ to confirm or ❌ to cancel",
+        value="Press ✅ Confirm to clear or ❌ Cancel to abort",
         inline=False
     )
     
-    msg = await ctx.send(embed=confirm_embed)
-    await msg.add_reaction("✅")
-    await msg.add_reaction("❌")
-    
-    def check(reaction, user):
-        return user == ctx.author and str(reaction.emoji) in ["✅", "❌"] and reaction.message.id == msg.id
-    
-    try:
-        reaction, user = await bot.wait_for('reaction_add', timeout=30.0, check=check)
+    async def do_clear() -> discord.Embed:
+        await db.clear_all_scammer_reports(user_id)
         
-        if str(reaction.emoji) == "✅":
-            db.clear_all_scammer_reports(user_id)
-            
-            success_embed = discord.Embed(
-                title="✅ All Reports Cleared",
-                description=f"All {report_count} scammer reports cleared for **{user_name}**",
-                color=discord.Color.green()
-            )
-            if member and hasattr(member, 'display_avatar'):
-                success_embed.set_thumbnail(url=member.display_avatar.url)
-            success_embed.set_footer(text=f"Cleared by {ctx.author.name}")
-            
-            await msg.edit(embed=success_embed)
-            await msg.clear_reactions()
-            
-            logging.info(f"Staff {ctx.author.name} cleared all scammer reports for {user_name}")
-        else:
-            cancel_embed = discord.Embed(
-                title="❌ Action Cancelled",
-                description="Clear all reports cancelled",
-                color=discord.Color.blue()
-            )
-            await msg.edit(embed=cancel_embed)
-            await msg.clear_reactions()
-    
-    except asyncio.TimeoutError:
-        timeout_embed = discord.Embed(
-            title="⏰ Confirmation Timeout",
-            description="Action cancelled due to timeout",
-            color=discord.Color.orange()
+        success_embed = discord.Embed(
+            title="✅ All Reports Cleared",
+            description=f"All {report_count} scammer reports cleared for **{user_name}**",
+            color=discord.Color.green()
         )
-        await msg.edit(embed=timeout_embed)
-        await msg.clear_reactions()
+        if member and hasattr(member, 'display_avatar'):
+            success_embed.set_thumbnail(url=member.display_avatar.url)
+        success_embed.set_footer(text=f"Cleared by {ctx.author.name}")
+        
+        logging.info(f"Staff {ctx.author.name} cleared all scammer reports for {user_name}")
+        return success_embed
+    
+    view = ConfirmView(ctx.author.id, do_clear, _CLEARALLSCAM_CANCELLED, _CONFIRM_TIMEOUT)
+    view.message = await ctx.send(embed=confirm_embed, view=view)
 
 """
 SCAMMER SYSTEM - PART 3: List All Scammers
@@ -1653,7 +2131,7 @@ Add this command after Part 2 commands
 async def listscammers_cmd(ctx):
     """View all users reported as scammers (Anyone can use)"""
     
-    scammers = db.get_all_scammers()
+    scammers = await db.get_all_scammers(limit=25)
     
     if not scammers:
         embed = discord.Embed(
@@ -1665,20 +2143,22 @@ async def listscammers_cmd(ctx):
         await ctx.send(embed=embed)
         return
     
+    # Only a full page needs a separate count
+    total = len(scammers) if len(scammers) < 25 else await db.count_scammers()
+    
     # Create embed with all scammers
     embed = discord.Embed(
         title="🚨 Reported Scammers List",
-        description=f"Total users with scammer reports: **{len(scammers)}**",
+        description=f"Total users with scammer reports: **{total}**",
         color=discord.Color.dark_red()
     )
     
     scammer_text = []
-    for idx, (user_id, report_count) in enumerate(scammers[:25], 1):  # Limit to 25 to avoid embed limits
-        user = bot.get_user(user_id)
+    for idx, (user_id, report_count) in enumerate(scammers, 1):
+        user_name = user_display_name(user_id)
         
-        if user:
-            user_name = f"{user.name}"
-            user_mention = user.mention
+        if user_name:
+            user_mention = f"<@{user_id}>"
         else:
             user_name = f"Unknown User"
             user_mention = f"ID: {user_id}"
@@ -1695,14 +2175,14 @@ async def listscammers_cmd(ctx):
     
     embed.add_field(
         name="📋 Scammer List",
-        value="\n".join(scammer_text),
+        value=join_field_lines(scammer_text)[0],
         inline=False
     )
     
-    if len(scammers) > 25:
+    if total > 25:
         embed.add_field(
             name="ℹ️ Note",
-            value=f"Showing top 25 of {len(scammers)} reported users",
+            value=f"Showing top 25 of {total} reported users",
             inline=False
         )
     
@@ -1734,22 +2214,20 @@ async def addrep_cmd(ctx, member: discord.Member, amount: int):
         await ctx.send("Amount must be greater than 0")
         return
     
-    old_rep = db.get_reputation(member.id)
-    db.add_reputation(member.id, amount)
-    new_rep = db.get_reputation(member.id)
-    
-    embed = discord.Embed(
-        title="✅ Reputation Added",
-        description=f"Added reputation to {member.mention}",
-        color=discord.Color.green()
-    )
-    
-    embed.add_field(name="Previous Rep", value=f"{old_rep} ⭐", inline=True)
-    embed.add_field(name="Amount Added", value=f"+{amount} ⭐", inline=True)
-    embed.add_field(name="New Total", value=f"{new_rep} ⭐", inline=True)
-    
-    embed.set_thumbnail(url=member.display_avatar.url)
-    embed.set_footer(text=f"Modified by {ctx.author.name}")
+    old_rep, new_rep = await db.adjust_reputation(member.id, amount)
+    
+    embed = discord.Embed.from_dict({
+        'title': "✅ Reputation Added",
+        'description': f"Added reputation to {member.mention}",
+        'color': discord.Color.green().value,
+        'fields': [
+            {'name': "Previous Rep", 'value': f"{old_rep} ⭐", 'inline': True},
+            {'name': "Amount Added", 'value': f"+{amount} ⭐", 'inline': True},
+            {'name': "New Total", 'value': f"{new_rep} ⭐", 'inline': True},
+        ],
+        'thumbnail': {'url': member.display_avatar.url},
+        'footer': {'text': f"Modified by {ctx.author.name}"},
+    })
     await ctx.send(embed=embed)
 
 @bot.command(name='removerep')
@@ -1760,22 +2238,20 @@ async def removerep_cmd(ctx, member: discord.Member, amount: int):
         await ctx.send("Amount must be greater than 0")
         return
     
-    old_rep = db.get_reputation(member.id)
-    db.remove_reputation(member.id, amount)
-    new_rep = db.get_reputation(member.id)
-    
-    embed = discord.Embed(
-        title="✅ Reputation Removed",
-        description=f"Removed reputation from {member.mention}",
-        color=discord.Color.orange()
-    )
-    
-    embed.add_field(name="Previous Rep", value=f"{old_rep} ⭐", inline=True)
-    embed.add_field(name="Amount Removed", value=f"-{amount} ⭐", inline=True)
-    embed.add_field(name="New Total", value=f"{new_rep} ⭐", inline=True)
-    
-    embed.set_thumbnail(url=member.display_avatar.url)
-    embed.set_footer(text=f"Modified by {ctx.author.name}")
+    old_rep, new_rep = await db.adjust_reputation(member.id, -amount)
+    
+    embed = discord.Embed.from_dict({
+        'title': "✅ Reputation Removed",
+        'description': f"Removed reputation from {member.mention}",
+        'color': discord.Color.orange().value,
+        'fields': [
+            {'name': "Previous Rep", 'value': f"{old_rep} ⭐", 'inline': True},
+            {'name': "Amount Removed", 'value': f"-{amount} ⭐", 'inline': True},
+            {'name': "New Total", 'value': f"{new_rep} ⭐", 'inline': True},
+        ],
+        'thumbnail': {'url': member.display_avatar.url},
+        'footer': {'text': f"Modified by {ctx.author.name}"},
+    })
     await ctx.send(embed=embed)
 
 @bot.command(name='setrep')
@@ -1786,29 +2262,36 @@ async def setrep_cmd(ctx, member: discord.Member, amount: int):
         await ctx.send("Amount cannot be negative")
         return
     
-    old_rep = db.get_reputation(member.id)
-    db.set_reputation(member.id, amount)
-    
-    embed = discord.Embed(
-        title="✅ Reputation Set",
-        description=f"Set reputation for {member.mention}",
-        color=discord.Color.blue()
-    )
-    
-    embed.add_field(name="Previous Rep", value=f"{old_rep} ⭐", inline=True)
-    embed.add_field(name="New Rep", value=f"{amount} ⭐", inline=True)
-    embed.add_field(name="Difference", value=f"{amount - old_rep:+d} ⭐", inline=True)
-    
-    embed.set_thumbnail(url=member.display_avatar.url)
-    embed.set_footer(text=f"Modified by {ctx.author.name}")
+    old_rep, new_rep = await db.set_reputation(member.id, amount)
+    
+    embed = discord.Embed.from_dict({
+        'title': "✅ Reputation Set",
+        'description': f"Set reputation for {member.mention}",
+        'color': discord.Color.blue().value,
+        'fields': [
+            {'name': "Previous Rep", 'value': f"{old_rep} ⭐", 'inline': True},
+            {'name': "New Rep", 'value': f"{new_rep} ⭐", 'inline': True},
+            {'name': "Difference", 'value': f"{new_rep - old_rep:+d} ⭐", 'inline': True},
+        ],
+        'thumbnail': {'url': member.display_avatar.url},
+        'footer': {'text': f"Modified by {ctx.author.name}"},
+    })
     await ctx.send(embed=embed)
 
+_CLEARREP_CANCELLED = discord.Embed(
+    title="❌ Action Cancelled",
+    description="Reputation clear cancelled",
+    color=discord.Color.blue()
+)
+
 @bot.command(name='clearrep')
 @is_owner()
 async def clearrep_cmd(ctx, member: discord.Member):
     """Clear all reputation data (Owner only)"""
-    old_rep = db.get_reputation(member.id)
-    vouch_count = len(db.get_vouch_history(member.id, limit=999))
+    old_rep, vouch_count = await asyncio.gather(
+        db.get_reputation(member.id),
+        db.count_vouches(member.id)
+    )
     
     confirm_embed = discord.Embed(
         title="⚠️ Confirm Clear Reputation",
@@ -1819,104 +2302,65 @@ async def clearrep_cmd(ctx, member: discord.Member):
     confirm_embed.add_field(name="Vouches to Clear", value=str(vouch_count), inline=True)
     confirm_embed.add_field(
         name="Confirmation",
-        value="React with ✅ to confirm or ❌ to cancel",
+        value="Press ✅ Confirm to clear or ❌ Cancel to abort",
         inline=False
     )
     
-    msg = await ctx.send(embed=confirm_embed)
-    await msg.add_reaction("✅")
-    await msg.add_reaction("❌")
-    
-    def check(reaction, user):
-        return user == ctx.author and str(reaction.emoji) in ["✅", "❌"] and reaction.message.id == msg.id
-    
-    try:
-        reaction, user = await bot.wait_for('reaction_add', timeout=30.0, check=check)
+    async def do_clear() -> discord.Embed:
+        await db.clear_reputation(member.id)
         
-        if str(reaction.emoji) == "✅":
-            db.clear_reputation(member.id)
-            
-            success_embed = discord.Embed(
-                title="✅ Reputation Cleared",
-                description=f"All reputation data cleared for {member.mention}",
-                color=discord.Color.green()
-            )
-            success_embed.add_field(name="Reputation Cleared", value=f"{old_rep} ⭐", inline=True)
-            success_embed.add_field(name="Vouches Cleared", value=str(vouch_count), inline=True)
-            success_embed.set_footer(text=f"Cleared by {ctx.author.name}")
-            
-            await msg.edit(embed=success_embed)
-            await msg.clear_reactions()
-        else:
-            cancel_embed = discord.Embed(
-                title="❌ Action Cancelled",
-                description="Reputation clear cancelled",
-                color=discord.Color.blue()
-            )
-            await msg.edit(embed=cancel_embed)
-            await msg.clear_reactions()
-    
-    except asyncio.TimeoutError:
-        timeout_embed = discord.Embed(
-            title="⏰ Confirmation Timeout",
-            description="Action cancelled due to timeout",
-            color=discord.Color.orange()
+        success_embed = discord.Embed(
+            title="✅ Reputation Cleared",
+            description=f"All reputation data cleared for {member.mention}",
+            color=discord.Color.green()
         )
-        await msg.edit(embed=timeout_embed)
-        await msg.clear_reactions()
+        success_embed.add_field(name="Reputation Cleared", value=f"{old_rep} ⭐", inline=True)
+        success_embed.add_field(name="Vouches Cleared", value=str(vouch_count), inline=True)
+        success_embed.set_footer(text=f"Cleared by {ctx.author.name}")
+        return success_embed
+    
+    view = ConfirmView(ctx.author.id, do_clear, _CLEARREP_CANCELLED, _CONFIRM_TIMEOUT)
+    view.message = await ctx.send(embed=confirm_embed, view=view)
+
+# Fields that only depend on Config
+_REPSTATS_CONFIG_FIELDS = (
+    {'name': "Vouch Cooldown", 'value': f"{Config.VOUCH_COOLDOWN_MINUTES} min", 'inline': True},
+    {'name': "Vouch Amount", 'value': f"{Config.VOUCH_REP_AMOUNT} ⭐", 'inline': True},
+    {'name': "Dummy Per Day", 'value': f"{Config.DUMMY_PER_DAY}x", 'inline': True},
+)
+_REPSTATS_DB_FIELD = {'name': "Database", 'value': "✅ PostgreSQL (Data persists forever)", 'inline': False}
 
 @bot.command(name='repstats')
 @is_owner()
 async def repstats_cmd(ctx):
     """View system statistics (Owner only)"""
-    leaderboard = db.get_leaderboard()
-    total_users = len(leaderboard)
-    total_rep = sum(rep for _, rep in leaderboard)
-    blacklist = db.get_blacklist()
-    
-    top_user = None
-    if leaderboard:
-        top_user_id, top_rep = leaderboard[0]
-        top_user = bot.get_user(top_user_id)
-    
-    embed = discord.Embed(
-        title="📊 Reputation System Statistics",
-        color=discord.Color.blue(),
-    )
-    
-    embed.add_field(name="Total Users", value=str(total_users), inline=True)
-    embed.add_field(name="Total Reputation", value=f"{total_rep} ⭐", inline=True)
-    embed.add_field(name="Blacklisted Users", value=str(len(blacklist)), inline=True)
-    
-    embed.add_field(name="Vouch Cooldown", value=f"{Config.VOUCH_COOLDOWN // 60} min", inline=True)
-    embed.add_field(name="Vouch Amount", value=f"{Config.VOUCH_REP_AMOUNT} ⭐", inline=True)
-    embed.add_field(name="Dummy Per Day", value=f"{Config.DUMMY_PER_DAY}x", inline=True)
-    
-    if top_user:
-        embed.add_field(
-            name="Top User",
-            value=f"{top_user.mention} - {leaderboard[0][1]} ⭐",
-            inline=False
-        )
-    
-    embed.add_field(
-        name="Database",
-        value="✅ PostgreSQL (Data persists forever)",
-        inline=False
-    )
-    
-    embed.set_footer(text=f"Requested by {ctx.author.name}")
+    stats = await db.get_stats()
+    blacklist = await db.get_blacklist()
+    
+    fields = [
+        {'name': "Total Users", 'value': str(stats['users']), 'inline': True},
+        {'name': "Total Reputation", 'value': f"{stats['total_rep']} ⭐", 'inline': True},
+        {'name': "Blacklisted Users", 'value': str(len(blacklist)), 'inline': True},
+        *_REPSTATS_CONFIG_FIELDS,
+    ]
+    if stats['top_user_id'] is not None:
+        top_name = stats['top_username'] or f"<@{stats['top_user_id']}>"
+        fields.append({'name': "Top User", 'value': f"{top_name} - {stats['top_rep']} ⭐", 'inline': False})
+    fields.append(_REPSTATS_DB_FIELD)
+    
+    embed = discord.Embed.from_dict({
+        'title': "📊 Reputation System Statistics",
+        'color': discord.Color.blue().value,
+        'fields': fields,
+        'footer': {'text': f"Requested by {ctx.author.name}"},
+    })
     await ctx.send(embed=embed)
 
 # ========================================
 # HELP COMMAND
 # ========================================
 
-@bot.command(name='help')
-async def help_cmd(ctx):
-    """Display all commands"""
-    is_owner_user = ctx.author.id == Config.OWNER_ID
-    
+def _build_help_embed(include_owner: bool) -> discord.Embed:
     embed = discord.Embed(
         title="📖 Reputation Bot - Commands",
         description=f"Prefix: `{Config.PREFIX}` | Commands 👇",
@@ -1939,7 +2383,7 @@ async def help_cmd(ctx):
         inline=False
     )
 
-    if is_owner_user:
+    if include_owner:
         embed.add_field(
             name="👑 Owner Commands",
             value=(
@@ -1960,13 +2404,24 @@ async def help_cmd(ctx):
     embed.add_field(
         name="ℹ️ Information",
         value=(
-            f"• Vouch: **{Config.VOUCH_REP_AMOUNT} rep** (cooldown: {Config.VOUCH_COOLDOWN // 60} min)\n"
+            f"• Vouch: **{Config.VOUCH_REP_AMOUNT} rep** (cooldown: {Config.VOUCH_COOLDOWN_MINUTES} min)\n"
             f"• Helpvouch: Staff Gives **2 rep per use**, Members Gives **1 rep per use**\n"
             f"• Dummy: Remove **1 rep** ({Config.DUMMY_PER_DAY}x limited uses per day)\n"
         ),
         inline=False
     )
+    return embed
+
+# Config is static, so both variants are built once at import
+_HELP_EMBED_PUBLIC = _build_help_embed(include_owner=False)
+_HELP_EMBED_OWNER = _build_help_embed(include_owner=True)
+
+@bot.command(name='help')
+async def help_cmd(ctx):
+    """Display all commands"""
+    is_owner_user = ctx.author.id == Config.OWNER_ID
     
+    embed = (_HELP_EMBED_OWNER if is_owner_user else _HELP_EMBED_PUBLIC).copy()
     embed.set_footer(text=f"Requested by {ctx.author.name}")
     await ctx.send(embed=embed)
 
@@ -2003,26 +2458,14 @@ async def on_command_error(ctx, error):
         pass
     
     else:
-        logging.error(f'Error in {ctx.command}: {error}')
+        logging.error('Error in %s: %s', ctx.command, error, exc_info=error)
         await ctx.send("An error occurred.")
 
 # ========================================
 # WEB SERVER FOR RENDER
 # ========================================
 
-async def start_keep_alive():
-    """Web server for Render"""
-    from aiohttp import web
-    
-    async def health(request):
-        return web.Response(text='Bot Online!', status=200)
-    
-    async def status_page(request):
-        leaderboard = db.get_leaderboard()
-        total_rep = sum(rep for _, rep in leaderboard)
-        blacklist = db.get_blacklist()
-        
-        html = f'''
+_STATUS_HTML = '''
 <!DOCTYPE html>
 <html>
 <head>
@@ -2063,21 +2506,61 @@ async def start_keep_alive():
     <div class="container">
         <h1>⭐ Reputation Bot</h1>
         <div class="status">✅ ONLINE</div>
-        <div class="info">Servers: {len(bot.guilds)}</div>
-        <div class="info">Total Users: {len(leaderboard)}</div>
+        <div class="info">Servers: {servers}</div>
+        <div class="info">Total Users: {users}</div>
         <div class="info">Total Rep: {total_rep}</div>
-        <div class="info">Blacklisted: {len(blacklist)}</div>
+        <div class="info">Blacklisted: {blacklisted}</div>
         <div class="info">Database: PostgreSQL ✅</div>
         <div style="margin-top: 20px;">
-            <span class="badge">Vouch: {Config.VOUCH_REP_AMOUNT}⭐</span>
-            <span class="badge">Cooldown: {Config.VOUCH_COOLDOWN // 60}m</span>
-            <span class="badge">Dummy: {Config.DUMMY_PER_DAY}x/day</span>
+            <span class="badge">Vouch: {vouch_amount}⭐</span>
+            <span class="badge">Cooldown: {cooldown_minutes}m</span>
+            <span class="badge">Dummy: {dummy_per_day}x/day</span>
         </div>
     </div>
 </body>
 </html>
-        '''
-        return web.Response(text=html, content_type='text/html')
+'''
+
+# Rendered status page; refreshed in the background once the bot is ready, so "/" never touches the DB
+_status_body = None
+
+async def render_status_page():
+    """Re-render the status page snapshot from current stats"""
+    global _status_body
+    stats = await db.get_stats()
+    blacklist = await db.get_blacklist()
+    _status_body = _STATUS_HTML.format(
+        servers=len(bot.guilds),
+        users=stats['users'],
+        total_rep=stats['total_rep'],
+        blacklisted=len(blacklist),
+        vouch_amount=Config.VOUCH_REP_AMOUNT,
+        cooldown_minutes=Config.VOUCH_COOLDOWN_MINUTES,
+        dummy_per_day=Config.DUMMY_PER_DAY
+    ).encode()
+
+@tasks.loop(seconds=60)
+async def refresh_status_task():
+    try:
+        await render_status_page()
+    except Exception as e:
+        logging.error(f"Error refreshing status page: {e}")
+
+_HEALTH_BODY = b'Bot Online!'
+_STARTING_BODY = b'Bot starting...'
+
+async def start_keep_alive():
+    """Web server for Render"""
+    from aiohttp import web
+    
+    async def health(request):
+        return web.Response(body=_HEALTH_BODY, content_type='text/plain')
+    
+    async def status_page(request):
+        # Uptime pingers should use /health
+        if _status_body is None:
+            return web.Response(body=_STARTING_BODY, content_type='text/plain')
+        return web.Response(body=_status_body, content_type='text/html', charset='utf-8')
     
     app = web.Application()
     app.router.add_get('/', status_page)
@@ -2089,7 +2572,7 @@ async def start_keep_alive():
     site = web.TCPSite(runner, '0.0.0.0', Config.PORT)
     await site.start()
     
-    logging.info(f'🌐 Web server: port {Config.PORT}')
+    logging.info('🌐 Web server: port %s', Config.PORT)
 
 # ========================================
 # MAIN STARTUP
@@ -2097,49 +2580,57 @@ async def start_keep_alive():
 
 async def main():
     """Main startup with retry logic"""
+    await db.connect()
     await start_keep_alive()
     
-    retry_count = 0
-    max_retries = 3
+    try:
+        retry_count = 0
+        max_retries = 3
     
-    while retry_count < max_retries:
-        try:
-            logging.info(f'Attempting to connect... (Attempt {retry_count + 1}/{max_retries})')
-            await bot.start(Config.TOKEN)
-            break
-        except discord.errors.HTTPException as e:
-            if e.status == 429:
-                retry_count += 1
-                wait_time = 300  # Wait 5 minutes
-                logging.error(f'🚫 Rate limited by Discord! Waiting {wait_time}s before retry...')
-                if retry_count < max_retries:
-                    await asyncio.sleep(wait_time)
+        while retry_count < max_retries:
+            try:
+                logging.info(f'Attempting to connect... (Attempt {retry_count + 1}/{max_retries})')
+                await bot.start(Config.TOKEN)
+                break
+            except discord.errors.HTTPException as e:
+                if e.status == 429:
+                    retry_count += 1
+                    wait_time = 300  # Wait 5 minutes
+                    logging.error(f'🚫 Rate limited by Discord! Waiting {wait_time}s before retry...')
+                    if retry_count < max_retries:
+                        await asyncio.sleep(wait_time)
+                    else:
+                        logging.error('Still rate limited. Please wait longer and try again.')
+                        break
                 else:
-                    logging.error('Still rate limited. Please wait longer and try again.')
+                    logging.error(f'HTTP error: {e}')
                     break
-            else:
-                logging.error(f'HTTP error: {e}')
+            except KeyboardInterrupt:
+                logging.info('Shutdown requested')
+                await bot.close()
                 break
-        except KeyboardInterrupt:
-            logging.info('Shutdown requested')
+            except Exception as e:
+                logging.error('Bot error: %s', e, exc_info=True)
+                break
+    finally:
+        if not bot.is_closed():
             await bot.close()
-            break
-        except Exception as e:
-            logging.error(f'Bot error: {e}')
-            break
+        await db.close()
 
 if __name__ == '__main__':
-    print('=' * 70)
-    print('REPUTATION BOT - PostgreSQL Version')
-    print('=' * 70)
-    print(f'Owner ID: {Config.OWNER_ID}')
-    print(f'Prefix: {Config.PREFIX}')
-    print(f'Vouch: {Config.VOUCH_REP_AMOUNT}⭐ | Cooldown: {Config.VOUCH_COOLDOWN // 60}m')
-    print(f'Helpvouch: Staff {Config.HELPVOUCH_REP_STAFF}⭐ | Member {Config.HELPVOUCH_REP_MEMBER}⭐')
-    print(f'Dummy: Remove {Config.DUMMY_REP_REMOVE}⭐ ({Config.DUMMY_PER_DAY}x/day)')
-    print(f'Database: PostgreSQL ✅')
-    print(f'Port: {Config.PORT}')
-    print('=' * 70)
+    print('\n'.join((
+        '=' * 70,
+        'REPUTATION BOT - PostgreSQL Version',
+        '=' * 70,
+        f'Owner ID: {Config.OWNER_ID}',
+        f'Prefix: {Config.PREFIX}',
+        f'Vouch: {Config.VOUCH_REP_AMOUNT}⭐ | Cooldown: {Config.VOUCH_COOLDOWN_MINUTES}m',
+        f'Helpvouch: Staff {Config.HELPVOUCH_REP_STAFF}⭐ | Member {Config.HELPVOUCH_REP_MEMBER}⭐',
+        f'Dummy: Remove {Config.DUMMY_REP_REMOVE}⭐ ({Config.DUMMY_PER_DAY}x/day)',
+        'Database: PostgreSQL ✅',
+        f'Port: {Config.PORT}',
+        '=' * 70
+    )))
     
     if not Config.TOKEN:
         print('\n❌ DISCORD_BOT_TOKEN not set!')
@@ -2151,7 +2642,13 @@ if __name__ == '__main__':
         exit(1)
     
     try:
-        asyncio.run(main())
+        import uvloop  # optional; faster event loop where available
+        run = uvloop.run
+    except ImportError:
+        run = asyncio.run
+    
+    try:
+        run(main())
     except KeyboardInterrupt:
         print('Bot stopped')
     except Exception as e: